@@ -0,0 +1,75 @@
+# Setting up a frame with many titles and children, with and without `batch`
+
+from contextlib import nullcontext
+from itertools import product
+from time import perf_counter
+
+from pyframe.border.border_types import Borders
+from pyframe.colors import Colors
+from pyframe.frame import Frame, Title
+from pyframe.types_ import Alignment, TitleSide
+
+TITLES, CHILDREN = 10, 20
+RUNS = 50
+
+title_draws = 0
+add_titles = Frame._add_titles
+
+
+def counted_add_titles(self, grid=None):
+    global title_draws
+    title_draws += len(self.titles)
+    add_titles(self, grid)
+
+
+Frame._add_titles = counted_add_titles
+
+
+def setup(batch: bool) -> Frame:
+    frame = Frame.empty_box(30, 120, Borders.Thin.SHARP)
+    with frame.batch() if batch else nullcontext():
+        frame.color_border(Colors.BLUE)
+        for i in range(TITLES):
+            frame.add_title(
+                Title(
+                    f"title {i}",
+                    Alignment.LEFT if i % 2 else Alignment.RIGHT,
+                    Colors.YELLOW,
+                    margin=2 + 12 * (i // 4),
+                    title_side=TitleSide.TOP if i % 4 < 2 else TitleSide.BOTTOM,
+                )
+            )
+        for row, column in product(range(CHILDREN // 10), range(10)):
+            frame.add_frame(
+                Frame.empty_box(6, 13, Borders.Thin.SHARP),
+                (row * 5 + 3, column * 12 + 1),
+                change_border_color=column == 9,
+            )
+    return frame
+
+
+for batch in (False, True):
+    title_draws = 0
+    start = perf_counter()
+    for _ in range(RUNS):
+        setup(batch)
+    print(
+        f"batch={batch}: {perf_counter() - start:.3f}s,"
+        f" {title_draws // RUNS} title draws per frame"
+    )
+
+assert setup(True).colored_str() == setup(False).colored_str()
+
+
+def toggled(batch: bool) -> Frame:
+    """A title added while the border is off."""
+    frame = Frame.empty_box(5, 20, Borders.Thin.SHARP)
+    with frame.batch() if batch else nullcontext():
+        frame.add_title(Title("A"))
+        frame.unborder()
+        frame.add_title(Title("B"))
+        frame.border()
+    return frame
+
+
+assert toggled(True).colored_str() == toggled(False).colored_str()
@@ -0,0 +1,29 @@
+# Toggling and restyling the border of a big frame
+
+from time import perf_counter
+
+from pyframe.border.border_types import Borders
+from pyframe.colors import Colors
+from pyframe.frame import Frame, Title
+
+HEIGHT, WIDTH = 200, 500
+TIMES = 100
+
+frame = Frame.empty_box(HEIGHT, WIDTH)
+frame.add_title(Title("big frame"))
+frame.color_border(Colors.BLUE)
+frame.write_text((5, 5), "content")
+before = frame.colored_str()
+
+start = perf_counter()
+for _ in range(TIMES):
+    frame.unborder()
+    frame.border()
+print(f"unborder + border: {(perf_counter() - start) / TIMES * 1000:.3f}ms")
+
+start = perf_counter()
+for border_type in [Borders.THICK, Borders.Thin.ROUND] * (TIMES // 2):
+    frame.set_border_type(border_type)
+print(f"set_border_type:   {(perf_counter() - start) / TIMES * 1000:.3f}ms")
+
+assert frame.colored_str() == before
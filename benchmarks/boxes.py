@@ -0,0 +1,27 @@
+# Creating many boxes of the same size, like the cells of a table
+
+from time import perf_counter
+
+from pyframe.border.border_types import Borders
+from pyframe.colors import Colors
+from pyframe.frame import Frame
+
+BOXES = 10_000
+
+start = perf_counter()
+for _ in range(BOXES):
+    Frame.empty_box(5, 20, Borders.Thin.SHARP)
+print(f"{BOXES} boxes: {perf_counter() - start:.3f}s")
+
+start = perf_counter()
+for _ in range(BOXES):
+    Frame.empty_box(5, 20, Borders.Thin.SHARP).color_border(Colors.BLUE)
+print(f"{BOXES} colored boxes: {perf_counter() - start:.3f}s")
+print(f"prototype hits: {Frame.prototypes.hits}, misses: {Frame.prototypes.misses}")
+
+Frame.prototypes.maxsize = 0
+Frame.prototypes.clear()
+start = perf_counter()
+for _ in range(BOXES):
+    Frame.empty_box(5, 20, Borders.Thin.SHARP)
+print(f"{BOXES} boxes without prototypes: {perf_counter() - start:.3f}s")
@@ -0,0 +1,23 @@
+# Building a 1000x1000 grid out of rows of cells
+
+from time import perf_counter
+
+from pyframe.colors import Colors
+from pyframe.grid import Cell, Grid
+
+SIZE = 1000
+
+cells = [Cell("#", Colors.GREEN), Cell(" "), Cell("x", Colors.RED)]
+rows = [[cells[(x + y) % 3] for x in range(SIZE)] for y in range(SIZE)]
+
+start = perf_counter()
+Grid([row[:] for row in rows])  # leveling out extends the rows
+print(f"Grid(rows): {perf_counter() - start:.3f}s")
+
+start = perf_counter()
+Grid.from_rows(rows)
+print(f"Grid.from_rows(rows): {perf_counter() - start:.3f}s")
+
+start = perf_counter()
+Grid.from_rows(rows, SIZE, trusted=True)
+print(f"Grid.from_rows(rows, trusted=True): {perf_counter() - start:.3f}s")
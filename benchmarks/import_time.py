@@ -0,0 +1,39 @@
+# Import time of pyframe, measured with `python -X importtime` in fresh interpreters
+# (run with bytecode caching on, otherwise compiling the modules dominates)
+
+import subprocess
+import sys
+
+MODULE = "pyframe.frame"
+RUNS = 10
+
+
+def import_times(module: str = MODULE) -> dict[str, tuple[int, int]]:
+    """Import `module` in a new interpreter: {module: (self us, cumulative us)}"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+if __name__ == "__main__":
+    best: dict[str, tuple[int, int]] = {}
+    for _ in range(RUNS):
+        for name, times in import_times().items():
+            if name not in best or times[1] < best[name][1]:
+                best[name] = times
+
+    print(f"best of {RUNS} runs (self / cumulative ms)")
+    for name, (self_us, cumulative_us) in best.items():
+        if name.startswith("pyframe") or name in ("json", "importlib.resources"):
+            print(f"{name:34} {self_us / 1000:6.2f} {cumulative_us / 1000:7.2f}")
@@ -0,0 +1,49 @@
+# Overlapping many boxes onto a canvas, merging junctions as each one is added
+# or ORing them into a JunctionLayer and resolving them once
+
+import random
+from time import perf_counter
+
+from pyframe.border.border_types import Borders
+from pyframe.border.junction_layer import JunctionLayer
+from pyframe.frame import Frame
+
+BOXES = 500
+
+random.seed(0)
+boxes = []
+for _ in range(BOXES):
+    size = random.randint(3, 20), random.randint(3, 40)
+    pos = random.randint(0, 80), random.randint(0, 160)
+    boxes.append((Frame.empty_box(*size, Borders.Thin.SHARP), pos))
+
+canvas = Frame.empty_box(100, 200)
+start = perf_counter()
+for box, pos in boxes:
+    canvas.add_frame(box, pos)
+print(f"add_frame: {perf_counter() - start:.3f}s")
+
+canvas = Frame.empty_box(100, 200)
+start = perf_counter()
+layer = JunctionLayer(canvas)
+for box, pos in boxes:
+    layer.add_grid(box, pos)
+layer.resolve()
+print(f"JunctionLayer: {perf_counter() - start:.3f}s")
+
+
+def borders(boxes: list[tuple[Frame, tuple[int, int]]]) -> str:
+    canvas = Frame.empty_box(100, 200)
+    layer = JunctionLayer(canvas)
+    for box, pos in boxes:
+        layer.add_border(box, pos)
+    layer.resolve()
+    return str(canvas)
+
+
+start = perf_counter()
+drawn = borders(boxes)
+print(f"JunctionLayer, borders only: {perf_counter() - start:.3f}s")
+
+# Borders join the same whatever order they're added in
+assert borders(boxes[::-1]) == drawn
@@ -0,0 +1,49 @@
+# Junction merging in large nested layouts (each add looks up the cell objects
+# on the edges of the added frame, not every cell of the parent)
+
+from itertools import product
+from time import perf_counter
+
+from pyframe.border.border_types import Borders
+from pyframe.border.junction import Junction
+from pyframe.frame import Frame
+from pyframe.types_ import Direction, Thickness
+
+ROWS, COLUMNS = 20, 20
+HEIGHT, WIDTH = 6, 12
+
+
+def nested_layout() -> Frame:
+    """A table of `ROWS` by `COLUMNS` frames sharing their borders."""
+    root = Frame.empty_box(
+        ROWS * (HEIGHT - 1) + 1, COLUMNS * (WIDTH - 1) + 1, Borders.Thin.SHARP
+    )
+    for row, column in product(range(ROWS), range(COLUMNS)):
+        root.add_frame(
+            Frame.empty_box(HEIGHT, WIDTH, Borders.Thin.SHARP),
+            (row * (HEIGHT - 1), column * (WIDTH - 1)),
+        )
+    return root
+
+
+def merges(times: int = 100) -> None:
+    thicknesses = [Thickness.THIN, Thickness.THICK]
+    junctions = [
+        Junction({Direction.LEFT: left, Direction.RIGHT: right}, "default")
+        for left, right in product(thicknesses, thicknesses)
+    ] + [
+        Junction({Direction.UP: up, Direction.DOWN: down}, "default")
+        for up, down in product(thicknesses, thicknesses)
+    ]
+    for _ in range(times):
+        for a, b in product(junctions, junctions):
+            a + b
+
+
+start = perf_counter()
+nested_layout()
+print(f"{ROWS * COLUMNS} nested frames: {perf_counter() - start:.3f}s")
+
+start = perf_counter()
+merges()
+print(f"6400 junction merges: {perf_counter() - start:.3f}s")
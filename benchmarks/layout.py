@@ -0,0 +1,36 @@
+# Laying out a dashboard of 50 rows of 20 cells on every terminal resize
+
+from time import perf_counter
+
+from pyframe.layout import Column, Fixed, Flex, Layout, Percent, Row
+
+layout = Layout(
+    Column(
+        *(
+            Row(
+                Column(size=Fixed(10)),
+                *(Column(size=Flex(i % 3 + 1), padding=1) for i in range(18)),
+                Column(size=Percent(10)),
+                size=Fixed(2),
+                gap=1,
+            )
+            for _ in range(50)
+        )
+    )
+)
+
+sizes = [(100 + i % 7, 300 + i % 11) for i in range(200)]
+
+start = perf_counter()
+layout.arrange(100, 300)
+print(f"first layout: {(perf_counter() - start) * 1000:.2f}ms")
+
+start = perf_counter()
+for size in sizes:
+    layout.arrange(*size)
+print(f"{len(sizes)} resizes: {(perf_counter() - start) * 1000 / len(sizes):.3f}ms each")
+
+start = perf_counter()
+for _ in range(200):
+    layout.arrange(100, 300)
+print(f"same size: {(perf_counter() - start) * 1000 / 200:.3f}ms each")
@@ -0,0 +1,34 @@
+# Drawing the boxes and connectors of a big diagram straight onto a frame,
+# compared to adding a frame for each box
+
+import random
+from time import perf_counter
+
+from pyframe.border.border_types import Borders
+from pyframe.frame import Frame
+
+BOXES = 300
+
+random.seed(0)
+boxes = []
+for _ in range(BOXES):
+    y, x = random.randint(0, 90), random.randint(0, 180)
+    boxes.append((y, x, y + random.randint(2, 8), x + random.randint(2, 18)))
+
+canvas = Frame.empty_box(100, 200)
+start = perf_counter()
+for top, left, bottom, right in boxes:
+    box = Frame.empty_box(bottom - top + 1, right - left + 1, Borders.Thin.SHARP)
+    canvas.add_frame(box, (top, left))
+print(f"{BOXES} boxes with add_frame: {perf_counter() - start:.3f}s")
+
+canvas = Frame.empty_box(100, 200)
+start = perf_counter()
+for top, left, bottom, right in boxes:
+    canvas.rect(((top, left), (bottom, right)), style="sharp")
+print(f"{BOXES} boxes with rect: {perf_counter() - start:.3f}s")
+
+start = perf_counter()
+for (top, left, _, _), (_, _, bottom, right) in zip(boxes, boxes[1:]):
+    canvas.polyline([(top, left), (top, right), (bottom, right)])
+print(f"{BOXES - 1} connectors with polyline: {perf_counter() - start:.3f}s")
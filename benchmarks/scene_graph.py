@@ -0,0 +1,70 @@
+# Re-rendering a dashboard where one panel out of 50 changes every tick
+
+from itertools import product
+from time import perf_counter
+
+from pyframe.border.border_types import Borders
+from pyframe.frame import Frame, Title
+
+ROWS, COLUMNS = 5, 10
+HEIGHT, WIDTH = 8, 20
+TICKS = 100
+
+
+def panel(row: int, column: int, tick: int = 0) -> Frame:
+    frame = Frame.empty_box(HEIGHT, WIDTH, Borders.Thin.SHARP)
+    frame.add_title(Title(f"panel {row}.{column}"))
+    frame.write_text((2, 2), f"value: {tick}")
+    return frame
+
+
+def immediate(tick: int) -> Frame:
+    """Build the whole dashboard again."""
+    root = Frame.empty_box(ROWS * (HEIGHT - 1) + 1, COLUMNS * (WIDTH - 1) + 1)
+    for row, column in product(range(ROWS), range(COLUMNS)):
+        root.add_frame(
+            panel(row, column, tick if (row, column) == (0, 0) else 0),
+            (row * (HEIGHT - 1), column * (WIDTH - 1)),
+        )
+    return root
+
+
+def retained() -> tuple[Frame, Frame]:
+    """The dashboard as a scene graph, and the panel that ticks."""
+    root = Frame.empty_box(ROWS * (HEIGHT - 1) + 1, COLUMNS * (WIDTH - 1) + 1)
+    panels = {}
+    for row, column in product(range(ROWS), range(COLUMNS)):
+        panels[row, column] = panel(row, column)
+        root.add_frame(
+            panels[row, column],
+            (row * (HEIGHT - 1), column * (WIDTH - 1)),
+            retained=True,
+        )
+    return root, panels[0, 0]
+
+
+start = perf_counter()
+for tick in range(TICKS):
+    str(immediate(tick))
+print(f"immediate, rebuilt every tick: {perf_counter() - start:.3f}s")
+
+root, ticking = retained()
+start = perf_counter()
+for tick in range(TICKS):
+    ticking.write_text((2, 2), f"value: {tick}")
+    str(root.render())
+print(f"retained, one panel changes:   {perf_counter() - start:.3f}s")
+
+assert str(root.render()) == str(immediate(TICKS - 1))
+
+# Retained frames sticking out of their parent are cut off the same way whether
+# it's drawn again whole or only where they moved
+root = Frame.empty_box(6, 20)
+moved = Frame.empty_box(4, 6)
+root.add_frame(moved, (1, 2), retained=True)
+root.add_frame(Frame.empty_box(4, 6), (1, 17), retained=True)
+root.render()
+root.move_frame(moved, (4, 2))
+incremental = str(root.render())
+root.invalidate()
+assert str(root.render()) == incremental
@@ -0,0 +1,35 @@
+# A 10,000x10,000 world map with a few things drawn on it
+
+import tracemalloc
+from time import perf_counter
+
+from pyframe.border.border_types import Borders
+from pyframe.colors import Colors
+from pyframe.frame import Frame
+from pyframe.renderer import Renderer
+from pyframe.sparse import SparseGrid
+
+SIZE = 10_000
+
+tracemalloc.start()
+start = perf_counter()
+
+world = SparseGrid(SIZE, SIZE)
+for i in range(100):
+    y, x = i * 97 % SIZE, i * 7919 % SIZE
+    world.write_text((y, x), f"town {i}", Colors.GREEN)
+    world[(y + 2, x) :] = Frame.empty_box(5, 20, Borders.Thin.SHARP)
+
+print(f"drawing: {perf_counter() - start:.3f}s")
+print(f"tiles: {world.tile_count}, memory: {tracemalloc.get_traced_memory()[0] / 1e6:.1f}MB")
+print(f"(a packed grid would take {SIZE * SIZE * 12 / 1e6:.0f}MB)")
+tracemalloc.stop()
+
+renderer = Renderer()
+start = perf_counter()
+renderer.render(world)
+print(f"first render: {perf_counter() - start:.3f}s")
+
+start = perf_counter()
+renderer.render(world)
+print(f"render without changes: {perf_counter() - start:.3f}s")
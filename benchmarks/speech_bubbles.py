@@ -0,0 +1,33 @@
+# Typing out 20 speech bubbles at once on one event loop, with no delays
+
+import asyncio
+import io
+from time import perf_counter
+
+from pyframe.renderer import Renderer
+from pyframe.speech_bubble import SpeechBubble
+
+message = "Hello there, this is a message that takes a few lines to type out. " * 2
+
+
+async def main() -> None:
+    bubbles = [
+        SpeechBubble(message, 6, 40, f"Speaker {i}", delays={}, default_delay=0)
+        for i in range(20)
+    ]
+    renderers = [Renderer(origin=(i // 4 * 6, i % 4 * 40)) for i in range(20)]
+    stream = io.StringIO()
+
+    start = perf_counter()
+    await asyncio.gather(
+        *(bubble.play(renderer, stream) for bubble, renderer in zip(bubbles, renderers))
+    )
+    print(f"play: {perf_counter() - start:.2f}s")
+
+    characters = sum(len(message.replace(" ", "")) for _ in bubbles)
+    redraw = len(bubbles[0].colored_str().encode())
+    print(f"bytes per character: {len(stream.getvalue().encode()) / characters:.1f}")
+    print(f"bytes per redraw of a bubble: {redraw}")
+
+
+asyncio.run(main())
@@ -0,0 +1,27 @@
+# Appending 200 chat messages to a textbox, in place vs making a new textbox
+
+from time import perf_counter
+
+from pyframe.textbox import Textbox
+from pyframe.types_ import VerticalAlignment
+
+options = dict(width=60, lines=200, vertical_text_alignment=VerticalAlignment.UP)
+
+messages = [
+    f"<user{i % 7}> message number {i}, saying hello to everyone. " for i in range(200)
+]
+
+start = perf_counter()
+text = ""
+for message in messages:
+    text += message
+    box = Textbox(text, **options)
+print(f"new textbox: {perf_counter() - start:.2f}s")
+
+start = perf_counter()
+box = Textbox("", **options)
+for message in messages:
+    box.append(message)
+print(f"append: {perf_counter() - start:.2f}s")
+
+assert str(box) == str(Textbox(text, **options))
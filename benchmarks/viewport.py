@@ -0,0 +1,39 @@
+# Panning a 24x80 camera across worlds of different sizes
+
+from time import perf_counter
+
+from pyframe.colors import Colors
+from pyframe.grid import Grid
+from pyframe.renderer import Renderer
+from pyframe.sparse import SparseGrid
+
+FRAMES = 200
+
+
+def world(grid: Grid) -> Grid:
+    for y in range(0, grid.height, 7):
+        for x in range(0, min(grid.width, 2000), 13):
+            grid.write_text((y, x), "*", Colors.GREEN)
+    return grid
+
+
+for name, grid in [
+    ("200x200 grid", world(Grid.empty(200, 200))),
+    ("2000x2000 grid", world(Grid.empty(2000, 2000))),
+    ("10,000x10,000 sparse grid", world(SparseGrid(10_000, 10_000))),
+]:
+    camera = grid.viewport((100, 100), (24, 80), center=True)
+    renderer = Renderer()
+    renderer.render(camera)
+
+    start = perf_counter()
+    written = 0
+    for i in range(FRAMES):
+        camera.scroll(i % 2, 1)
+        written += len(renderer.render(camera))
+    elapsed = perf_counter() - start
+
+    print(
+        f"{name}: {elapsed / FRAMES * 1000:.2f}ms and "
+        f"{written // FRAMES} bytes per frame"
+    )
@@ -1,9 +1,10 @@
-from copy import copy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 from pyframe.border.junction import Junction
-from pyframe.grid import Cell
+from pyframe.colors import Color
+from pyframe.grid import Cell, PackedCells
 from pyframe.types_ import Direction, Thickness
 
 
@@ -20,7 +21,7 @@ class BorderPattern:
         self.pattern = pattern
 
     def __mul__(self, times):
-        return [copy(self.pattern[i % len(self.pattern)]) for i in range(times)]
+        return [self.pattern[i % len(self.pattern)] for i in range(times)]
 
     @classmethod
     def from_string(cls, string: str):
@@ -167,17 +168,28 @@ class BorderType:
             title_right_top=Junction({Direction.RIGHT: top}, top_style),
         )
 
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        self.__dict__.pop("_glyphs", None)  # compiled from the old value
+
+    def glyphs(self) -> "BorderGlyphs":
+        """The border type compiled into cells, kept until the border type changes."""
+        glyphs = self.__dict__.get("_glyphs")
+        if glyphs is None:
+            glyphs = self.__dict__["_glyphs"] = BorderGlyphs(self)
+        return glyphs
+
     def set_vertical_style(self, vertical: str):
         if isinstance(self.left_vertical, Junction):
-            self.left_vertical.style = vertical
+            self.left_vertical = self.left_vertical.with_style(vertical)
         if isinstance(self.right_vertical, Junction):
-            self.right_vertical.style = vertical
+            self.right_vertical = self.right_vertical.with_style(vertical)
 
     def set_horizontal_style(self, horizontal: str):
         if isinstance(self.top_horizontal, Junction):
-            self.top_horizontal.style = horizontal
+            self.top_horizontal = self.top_horizontal.with_style(horizontal)
         if isinstance(self.bottom_horizontal, Junction):
-            self.bottom_horizontal.style = horizontal
+            self.bottom_horizontal = self.bottom_horizontal.with_style(horizontal)
 
     def __repr__(self) -> str:
         return (
@@ -190,10 +202,8 @@ class BorderType:
 class Border:
     def __init__(self, border_type: BorderType):
         def create_instance(border_junctions: BorderJunctions):
-            if isinstance(border_junctions, BorderPattern):
+            if isinstance(border_junctions, (BorderPattern, Junction)):
                 return border_junctions
-            elif isinstance(border_junctions, Junction):
-                return copy(border_junctions)
 
             return Cell(border_junctions)
 
@@ -206,3 +216,56 @@ class Border:
         self.left_vertical = create_instance(border_type.left_vertical)
         self.bottom_horizontal = create_instance(border_type.bottom_horizontal)
         self.right_vertical = create_instance(border_type.right_vertical)
+
+
+class BorderGlyphs(Border):
+    """The cells of a `BorderType`, with the edges of each length memoized.
+
+    Get it with `BorderType.glyphs()`.
+    """
+
+    EDGE_CACHE_SIZE = 64
+
+    def __init__(self, border_type: BorderType):
+        super().__init__(border_type)
+
+        def cap(junction: CornerJunction) -> str:
+            return junction if isinstance(junction, str) else junction.value
+
+        self.title_left_top = cap(border_type.title_left_top)
+        self.title_right_top = cap(border_type.title_right_top)
+        self.title_left_bottom = cap(border_type.title_left_bottom)
+        self.title_right_bottom = cap(border_type.title_right_bottom)
+
+        # Per instance, `BorderType`s aren't hashable
+        self.top_row = lru_cache(self.EDGE_CACHE_SIZE)(self._top_row)
+        self.bottom_row = lru_cache(self.EDGE_CACHE_SIZE)(self._bottom_row)
+        self.left_column = lru_cache(self.EDGE_CACHE_SIZE)(self._left_column)
+        self.right_column = lru_cache(self.EDGE_CACHE_SIZE)(self._right_column)
+
+    def _top_row(self, width: int, color: Optional[Color] = None) -> PackedCells:
+        """The top row of a border `width` cells wide on the inside."""
+        return _pack_colored(
+            (self.top_right, *(self.top_horizontal * width), self.top_left), color
+        )
+
+    def _bottom_row(self, width: int, color: Optional[Color] = None) -> PackedCells:
+        return _pack_colored(
+            (self.bottom_right, *(self.bottom_horizontal * width), self.bottom_left),
+            color,
+        )
+
+    def _left_column(self, height: int, color: Optional[Color] = None) -> PackedCells:
+        """The left side of a border `height` cells tall on the inside."""
+        return _pack_colored(tuple(self.left_vertical * height), color)
+
+    def _right_column(self, height: int, color: Optional[Color] = None) -> PackedCells:
+        return _pack_colored(tuple(self.right_vertical * height), color)
+
+
+def _pack_colored(cells: tuple[Cell, ...], color: Optional[Color]) -> PackedCells:
+    if color is not None:
+        colored = {cell: cell.with_color(color) for cell in set(cells)}
+        cells = tuple(colored[cell] for cell in cells)
+
+    return PackedCells.pack(cells)
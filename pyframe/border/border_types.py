@@ -1,7 +1,26 @@
 from copy import copy, deepcopy
+from typing import Callable, Generic, TypeVar
+
 from pyframe.border.border_type import BorderPattern, BorderType
 from pyframe.types_ import Thickness
 
+T = TypeVar("T")
+
+
+class _Lazy(Generic[T]):
+    """A class attribute made by `factory` the first time it's accessed."""
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self.factory = factory
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: object, owner: type) -> T:
+        value = self.factory()
+        setattr(owner, self.name, value)  # replaces the descriptor
+        return value
+
 
 class Borders:
     """
@@ -17,96 +36,112 @@ class Borders:
     ```
     """
 
-    THICK = BorderType.thickness(thickness=Thickness.THICK)
-    DOUBLE = BorderType.thickness(thickness=Thickness.DOUBLE)
+    THICK = _Lazy(lambda: BorderType.thickness(thickness=Thickness.THICK))
+    DOUBLE = _Lazy(lambda: BorderType.thickness(thickness=Thickness.DOUBLE))
 
     class Thin:
-        ROUND = BorderType.thickness(thickness=Thickness.THIN, corner_style="round")
-        SHARP = BorderType.thickness(thickness=Thickness.THIN, corner_style="sharp")
+        ROUND = _Lazy(
+            lambda: BorderType.thickness(thickness=Thickness.THIN, corner_style="round")
+        )
+        SHARP = _Lazy(
+            lambda: BorderType.thickness(thickness=Thickness.THIN, corner_style="sharp")
+        )
 
         Dashed: "type[_Dashed]"
 
     class OverlapClassic:
-        DASHED = BorderType(
-            top_right="+",
-            top_left="+",
-            bottom_right="+",
-            bottom_left="+",
-            top_horizontal="-",
-            left_vertical="|",
-            bottom_horizontal="-",
-            right_vertical="|",
-            title_right_top="-",
-            title_left_bottom="-",
-            title_left_top="-",
-            title_right_bottom="-",
+        DASHED = _Lazy(
+            lambda: BorderType(
+                top_right="+",
+                top_left="+",
+                bottom_right="+",
+                bottom_left="+",
+                top_horizontal="-",
+                left_vertical="|",
+                bottom_horizontal="-",
+                right_vertical="|",
+                title_right_top="-",
+                title_left_bottom="-",
+                title_left_top="-",
+                title_right_bottom="-",
+            )
         )
-        DOUBLE = BorderType(
-            top_right="+",
-            top_left="+",
-            bottom_right="+",
-            bottom_left="+",
-            top_horizontal="=",
-            left_vertical="|",
-            bottom_horizontal="=",
-            right_vertical="|",
-            title_right_top="=",
-            title_left_bottom="=",
-            title_left_top="=",
-            title_right_bottom="=",
+        DOUBLE = _Lazy(
+            lambda: BorderType(
+                top_right="+",
+                top_left="+",
+                bottom_right="+",
+                bottom_left="+",
+                top_horizontal="=",
+                left_vertical="|",
+                bottom_horizontal="=",
+                right_vertical="|",
+                title_right_top="=",
+                title_left_bottom="=",
+                title_left_top="=",
+                title_right_bottom="=",
+            )
         )
-        UNDERSCORE = BorderType(
-            top_right=" ",
-            top_left=" ",
-            bottom_right="|",
-            bottom_left="|",
-            top_horizontal="_",
-            left_vertical="|",
-            bottom_horizontal="_",
-            right_vertical="|",
-            title_right_top="_",
-            title_left_bottom="_",
-            title_left_top="_",
-            title_right_bottom="_",
+        UNDERSCORE = _Lazy(
+            lambda: BorderType(
+                top_right=" ",
+                top_left=" ",
+                bottom_right="|",
+                bottom_left="|",
+                top_horizontal="_",
+                left_vertical="|",
+                bottom_horizontal="_",
+                right_vertical="|",
+                title_right_top="_",
+                title_left_bottom="_",
+                title_left_top="_",
+                title_right_bottom="_",
+            )
         )
-        OVERSCORE = BorderType(
-            top_right="|",
-            top_left="|",
-            bottom_right=" ",
-            bottom_left=" ",
-            top_horizontal="‾",
-            left_vertical="|",
-            bottom_horizontal="‾",
-            right_vertical="|",
-            title_right_top="‾",
-            title_left_bottom="‾",
-            title_left_top="‾",
-            title_right_bottom="‾",
+        OVERSCORE = _Lazy(
+            lambda: BorderType(
+                top_right="|",
+                top_left="|",
+                bottom_right=" ",
+                bottom_left=" ",
+                top_horizontal="‾",
+                left_vertical="|",
+                bottom_horizontal="‾",
+                right_vertical="|",
+                title_right_top="‾",
+                title_left_bottom="‾",
+                title_left_top="‾",
+                title_right_bottom="‾",
+            )
         )
 
     ThickDashed: "type[_ThickDashed]"
     Castle: "type[_Castle]"
 
 
-def get_dashed_from(parent) -> tuple[BorderType, BorderType, BorderType]:
-    triple = deepcopy(parent)
-    triple.set_vertical_style("triple_dash")
-    triple.set_horizontal_style("triple_dash")
+def get_dashed(parent: BorderType, style: str) -> BorderType:
+    dashed = deepcopy(parent)
+    dashed.set_vertical_style(style)
+    dashed.set_horizontal_style(style)
+    return dashed
+
 
-    quad = deepcopy(parent)
-    quad.set_vertical_style("quad_dash")
-    quad.set_horizontal_style("quad_dash")
+def get_dashed_from(parent) -> tuple[BorderType, BorderType, BorderType]:
+    return (
+        get_dashed(parent, "triple_dash"),
+        get_dashed(parent, "quad_dash"),
+        get_dashed(parent, "duo_dash"),
+    )
 
-    duo = deepcopy(parent)
-    duo.set_vertical_style("duo_dash")
-    duo.set_horizontal_style("duo_dash")
 
-    return triple, quad, duo
+def get_castle(parent: BorderType) -> BorderType:
+    castle = copy(parent)
+    castle.top_horizontal = BorderPattern.from_string("─⍽")
+    return castle
 
 
 class _Castle:
-    ROUND = copy(Borders.Thin.ROUND)
-    ROUND.top_horizontal = BorderPattern.from_string("─⍽")
+    ROUND = _Lazy(lambda: get_castle(Borders.Thin.ROUND))
 
 
 Borders.Castle = _Castle
@@ -114,17 +149,23 @@ Borders.Castle = _Castle
 
 class _Dashed:
     class Round:
-        TRIPLE, QUAD, DUO = get_dashed_from(Borders.Thin.ROUND)
+        TRIPLE = _Lazy(lambda: get_dashed(Borders.Thin.ROUND, "triple_dash"))
+        QUAD = _Lazy(lambda: get_dashed(Borders.Thin.ROUND, "quad_dash"))
+        DUO = _Lazy(lambda: get_dashed(Borders.Thin.ROUND, "duo_dash"))
 
     class Sharp:
-        TRIPLE, QUAD, DUO = get_dashed_from(Borders.Thin.SHARP)
+        TRIPLE = _Lazy(lambda: get_dashed(Borders.Thin.SHARP, "triple_dash"))
+        QUAD = _Lazy(lambda: get_dashed(Borders.Thin.SHARP, "quad_dash"))
+        DUO = _Lazy(lambda: get_dashed(Borders.Thin.SHARP, "duo_dash"))
 
 
 Borders.Thin.Dashed = _Dashed
 
 
 class _ThickDashed:
-    TRIPLE, QUAD, DUO = get_dashed_from(Borders.THICK)
+    TRIPLE = _Lazy(lambda: get_dashed(Borders.THICK, "triple_dash"))
+    QUAD = _Lazy(lambda: get_dashed(Borders.THICK, "quad_dash"))
+    DUO = _Lazy(lambda: get_dashed(Borders.THICK, "duo_dash"))
 
 
 Borders.Thin = Borders.Thin
@@ -1,96 +1,174 @@
-from json import load
-from typing import Self
+from functools import cache
+from typing import Optional, Self
 
+from pyframe.border.junction_table import GLYPHS, STYLES
 from pyframe.colors import Color, Colors
-from pyframe.grid import Cell
+from pyframe.grid import Cell, Grid
 from pyframe.types_ import Direction, Thickness
 
-# TABLE[UP][DOWN][LEFT][RIGHT] -> Junction string
-TABLE = load(open(r"pyframe\border\junctions.json", encoding="utf-8"))
 DIRECTION_ORDER = [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]
 
 JunctionDict = dict[Direction, Thickness]
 
-class Junction(Cell):
-    """A `Cell` that is a part of a border of a `Frame`."""
+# Each direction has 2 bits of a junction mask: UP is the highest, RIGHT the lowest
+THICKNESS_CODES = {None: 0, Thickness.THIN: 1, Thickness.THICK: 2, Thickness.DOUBLE: 3}
+THICKNESSES = (None, Thickness.THIN, Thickness.THICK, Thickness.DOUBLE)
+SHIFTS = {direction: 6 - 2 * i for i, direction in enumerate(DIRECTION_ORDER)}
 
-    def __init__(
-        self,
-        dct: JunctionDict,
-        style: str,
-        color: Color = Colors.DEFAULT,
-    ) -> None:
-        self._directions = dct
-        self.style = style
-        self.color = color
 
-        self._update_value()
+def directions_to_mask(dct: JunctionDict) -> int:
+    mask = 0
+    for direction, thickness in dct.items():
+        mask |= THICKNESS_CODES[thickness] << SHIFTS[direction]
+    return mask
 
-    def _update_value(self):
-        """Update the junction `value` with changed `_directions`."""
 
-        def get_directional_thickness(direction):
-            result = self._directions.get(direction)
-            if result:
-                return result.value
-            else:
-                return "none"
+def mask_to_directions(mask: int) -> JunctionDict:
+    return {
+        direction: THICKNESSES[mask >> shift & 0b11]
+        for direction, shift in SHIFTS.items()
+        if mask >> shift & 0b11
+    }
 
-        junction: str | dict[str, str] = TABLE[
-            get_directional_thickness(DIRECTION_ORDER[0])
-        ][get_directional_thickness(DIRECTION_ORDER[1])][
-            get_directional_thickness(DIRECTION_ORDER[2])
-        ][
-            get_directional_thickness(DIRECTION_ORDER[3])
-        ]
 
-        # Style
-        if isinstance(junction, dict):
-            junction = junction[self.style or "default"]
+def merge_masks(mask: int, over: int) -> int:
+    """Combine two junction masks, the thicknesses of `over` winning."""
+    present = (over | over >> 1) & 0b01010101
+    return mask & ~(present | present << 1) | over
 
-        self.value = junction
+
+STYLE_INDEXES = {style: i for i, style in enumerate(STYLES)}
+OTHER_STYLE = len(STYLES)
+
+
+class Junction(Cell):
+    """A `Cell` that is a part of a border of a `Frame`.
+
+    Like cells, junctions are immutable and interned. The directions are stored
+    as a mask of 2 bits per direction, so merging is a couple of integer
+    operations and a lookup in `GLYPHS`.
+    """
+
+    __slots__ = ("_mask", "_code", "style")
+
+    _mask: int
+    _code: int
+    style: str
+
+    def __new__(
+        cls,
+        dct: JunctionDict,
+        style: str,
+        color: Color = Colors.DEFAULT,
+    ) -> Self:
+        return cls._from_mask(directions_to_mask(dct), style, color)
+
+    @classmethod
+    def _from_mask(cls, mask: int, style: str, color: Optional[Color]) -> Self:
+        color = color or Colors.DEFAULT
+
+        key = (cls, mask, style, color)
+        junction = Cell._interned.get(key)
+        if junction is None:
+            code = STYLE_INDEXES.get(style or "default", OTHER_STYLE) << 8 | mask
+            value = GLYPHS[code]
+            if value is None:
+                raise KeyError(f"no junction for {mask_to_directions(mask)} {style}")
+
+            junction = object.__new__(cls)
+            object.__setattr__(junction, "_mask", mask)
+            object.__setattr__(junction, "_code", code)
+            object.__setattr__(junction, "style", style)
+            object.__setattr__(junction, "color", color)
+            object.__setattr__(junction, "background", None)
+            object.__setattr__(junction, "value", value)
+            Cell._interned[key] = junction
+
+        return junction
+
+    @property
+    def _directions(self) -> JunctionDict:
+        return mask_to_directions(self._mask)
 
     def __repr__(self):
         return self.value
 
     def __add__(self, junction: Self) -> Self:
-        return type(self)(
-            self._directions | junction._directions,
-            "default",  # 'default' because you cant have dashed ┯
+        mask = merge_masks(self._mask, junction._mask)
+        return type(self)._from_mask(
+            mask,
+            # 'default' because you cant have dashed ┯, but corners need a style
+            "default" if GLYPHS[mask] is not None else junction.style,
             junction.color,
         )
 
+    def without(self, direction: Direction) -> Self:
+        """The junction without a line going in `direction`."""
+        mask = self._mask & ~(0b11 << SHIFTS[direction])
+        if mask == self._mask:
+            return self
+
+        return type(self)._from_mask(mask, self.style, self.color)
+
+    def with_color(self, color: Optional[Color]) -> Self:
+        return type(self)._from_mask(self._mask, self.style, color)
+
+    def with_style(self, style: str) -> Self:
+        return type(self)._from_mask(self._mask, style, self.color)
+
     def __mul__(self, times: int) -> list[Self]:
-        return [
-            type(self)(self._directions, self.style, self.color) for _ in range(times)
-        ]
+        return [self] * times
+
+    def _key(self) -> tuple:
+        return (type(self), self._mask, self.style, self.color)
+
+    def __reduce__(self):
+        return (type(self), (self._directions, self.style, self.color))
+
+    @classmethod
+    def from_string(cls, string: str) -> "Junction | Cell":
+        """Get the junction a box-drawing character is (or a `Cell` if it isn't one)."""
+        found = glyph_index().get(string)
+        if found is None:
+            return Cell(string)
 
-    def __copy__(self):
-        return type(self)(self._directions, self.style, self.color)
+        mask, style = found
+        return cls._from_mask(mask, style, Colors.DEFAULT)
 
     @classmethod
-    def from_string(cls, string: str):
-        def get_path(
-            nested_dict, value, pre=()
-        ) -> tuple[str, str, str, str, str] | None:
-            for k, v in nested_dict.items():
-                path = pre + (k,)
-                if v == value:
-                    return path
-                elif hasattr(v, "items"):
-                    p = get_path(v, value, path)
-                    if p is not None:
-                        return p
-
-        result = get_path(TABLE, string)
-        if not result:
-            return super()(string)
-
-        *path, style = result
-
-        dct = {}
-        for i, thickness in enumerate(path):
-            if thickness != "none":
-                dct[DIRECTION_ORDER[i]] = Thickness.__getitem__(thickness.upper())
-
-        return Junction(dct, style)
+    def parse_grid(cls, text: str, color: Color = Colors.DEFAULT) -> Grid:
+        """Create a grid from a hand-drawn box-drawing diagram in one pass.
+
+        Box-drawing characters become junctions, so frames added onto the grid
+        merge with them.
+        """
+        grid = Grid(text)
+        grid.color_all(color)
+
+        index = glyph_index()
+        for y, line in enumerate(text.split("\n")):
+            start = grid._row_start(y)
+            for x, char in enumerate(line):
+                found = index.get(char)
+                if found is not None:
+                    grid._store(start + x, cls._from_mask(*found, color))
+
+        return grid
+
+
+@cache
+def glyph_index() -> dict[str, tuple[int, str]]:
+    """Map each junction string to its `(mask, style)`, built on first use.
+
+    Strings used by several styles get the first style (`"default"` if it has one).
+    Blank entries aren't junctions.
+    """
+    index = {}
+    for code, glyph in enumerate(GLYPHS):
+        style_index = code >> 8
+        if glyph is None or glyph.isspace() or style_index == OTHER_STYLE:
+            continue
+
+        index.setdefault(glyph, (code & 0xFF, STYLES[style_index]))
+
+    return index
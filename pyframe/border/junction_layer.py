@@ -0,0 +1,228 @@
+from functools import cache
+from typing import Optional
+
+from pyframe.border.junction import (
+    GLYPHS,
+    SHIFTS,
+    STYLE_INDEXES,
+    STYLES,
+    Junction,
+    mask_to_directions,
+)
+from pyframe.colors import Color
+from pyframe.frame import ring_edges
+from pyframe.grid import Grid
+from pyframe.types_ import Direction
+from pyframe.vector import VectorLike, VectorYX
+
+# In a layer, each direction of a cell has a bit per thickness (in the order of
+# `THICKNESSES`, 3 bits instead of the 2 bit code of junction masks) so drawing
+# over a cell is just an OR. The heaviest thickness wins when resolving. The
+# styles drawn into the cell are bits above the lines.
+LINE_BITS = 3
+STYLE_SHIFT = 4 * LINE_BITS
+LINES = (1 << STYLE_SHIFT) - 1
+
+OFFSETS = {
+    Direction.UP: (-1, 0),
+    Direction.DOWN: (1, 0),
+    Direction.LEFT: (0, -1),
+    Direction.RIGHT: (0, 1),
+}
+
+
+def _slot(direction: Direction) -> int:
+    return SHIFTS[direction] // 2 * LINE_BITS
+
+
+def layer_bits(junction: Junction) -> int:
+    """The bits a junction ORs into a cell of a layer."""
+    return _layer_bits(junction._mask, junction.style)
+
+
+@cache
+def _layer_bits(mask: int, style: Optional[str]) -> int:
+    bits = 1 << STYLE_SHIFT + STYLE_INDEXES.get(style or "default", 0)
+    for slot in range(4):
+        code = mask >> 2 * slot & 0b11
+        if code:
+            bits |= 1 << slot * LINE_BITS + code - 1
+    return bits
+
+
+@cache
+def resolve_bits(bits: int) -> tuple[int, str]:
+    """The junction mask and style of the bits of a cell of a layer.
+
+    If a single style was drawn into the cell it's kept if it has the glyph,
+    otherwise `"default"` is preferred, then the first style that has it.
+    """
+    mask = 0
+    for slot in range(4):
+        thicknesses = bits >> slot * LINE_BITS & 0b111
+        if thicknesses:
+            mask |= thicknesses.bit_length() << 2 * slot
+
+    styles = [i for i in range(len(STYLES)) if bits >> STYLE_SHIFT + i & 1]
+    if len(styles) == 1 and GLYPHS[styles[0] << 8 | mask] is not None:
+        return mask, STYLES[styles[0]]
+
+    for i in (0, *styles, *range(len(STYLES))):
+        if GLYPHS[i << 8 | mask] is not None:
+            return mask, STYLES[i]
+
+    raise KeyError(f"no junction for {mask_to_directions(mask)}")
+
+
+class JunctionLayer:
+    """The lines of a grid kept as per-cell masks, resolved into glyphs in one pass.
+
+    Junctions drawn through the layer are ORed into the masks of their cells, and
+    each cell is looked up once by `resolve` however many borders cross it.
+
+    ```
+    layer = JunctionLayer(canvas)
+    for frame, pos in boxes:
+        layer.add_grid(frame, pos)
+    layer.resolve()
+    ```
+
+    With `add_grid` the cells other than lines are drawn straight onto the grid,
+    and cover the lines under them, so a frame added later hides the lines inside
+    of it (like `add_frame`) and the order frames are added in matters. Only
+    borders added with `add_border` join the same in any order. The color of a
+    line is the color it was drawn with last.
+    """
+
+    def __init__(self, grid: Grid) -> None:
+        self.grid = grid
+
+        self._bits: dict[int, int] = {}
+        self._colors: dict[int, Optional[Color]] = {}
+
+        for i, y, x in grid._objects_in((0, 0), grid.height, grid.width):
+            junction = grid._objects[i]
+            if isinstance(junction, Junction):
+                self._or(i, junction)
+
+    def _or(self, index: int, junction: Junction) -> None:
+        self._bits[index] = self._bits.get(index, 0) | layer_bits(junction)
+        self._colors[index] = junction.color
+
+    def add(self, pos: VectorLike, junction: Junction) -> None:
+        """Draw `junction` at `pos`, joining the lines already there."""
+        self._or(self.grid._index(*VectorYX(pos)), junction)
+
+    def add_grid(self, grid: Grid, pos: VectorLike = (0, 0)) -> None:
+        """Draw `grid` (like a frame) with its top left at `pos`, joining its
+        junctions with the lines already there.
+
+        Cells that aren't junctions cover the lines under them, and the lines
+        leading into them are cut off.
+        """
+        pos_y, pos_x = VectorYX(pos)
+        top, left = max(pos_y, 0), max(pos_x, 0)
+        bottom = min(pos_y + grid.height, self.grid.height)
+        right = min(pos_x + grid.width, self.grid.width)
+        if top >= bottom or left >= right:
+            return
+
+        region = self.grid[(top, left) : (bottom - 1, right - 1)]
+        region._copy_region(grid, (top - pos_y, left - pos_x))
+
+        junctions = {}
+        for i, y, x in grid._objects_in(
+            (top - pos_y, left - pos_x), bottom - top, right - left
+        ):
+            if isinstance(grid._objects[i], Junction):
+                junctions[self.grid._index(y + pos_y, x + pos_x)] = grid._objects[i]
+
+        covered = []
+        for i, y, x in self._lines_in(top, left, bottom, right):
+            if i not in junctions:
+                del self._bits[i]
+                del self._colors[i]
+                covered.append((y, x))
+
+        for i, junction in junctions.items():
+            self._or(i, junction)
+
+        for y, x in covered:
+            self._cut_towards(y, x)
+
+        self.grid._changed()
+
+    def add_border(self, grid: Grid, pos: VectorLike = (0, 0)) -> None:
+        """Draw only the junctions on the edges of `grid` (like the border of a
+        frame) with its top left at `pos`, joining them with the lines already
+        there. Nothing is covered.
+        """
+        pos_y, pos_x = VectorYX(pos)
+        for top, left, bottom, right in ring_edges(
+            (0, 0, grid.height - 1, grid.width - 1)
+        ):
+            for i, y, x in grid._objects_in(
+                (top, left), bottom - top + 1, right - left + 1
+            ):
+                y, x = y + pos_y, x + pos_x
+                junction = grid._objects[i]
+                if (
+                    0 <= y < self.grid.height
+                    and 0 <= x < self.grid.width
+                    and isinstance(junction, Junction)
+                ):
+                    self._or(self.grid._index(y, x), junction)
+
+    def _lines_in(
+        self, top: int, left: int, bottom: int, right: int
+    ) -> list[tuple[int, int, int]]:
+        """The `(index, y, x)` of the line cells in a region (`bottom` and `right`
+        exclusive).
+        """
+        lines = []
+        if (bottom - top) * (right - left) < len(self._bits):
+            for y in range(top, bottom):
+                start = self.grid._row_start(y)
+                for x in range(left, right):
+                    if start + x in self._bits:
+                        lines.append((start + x, y, x))
+            return lines
+
+        for i in self._bits:
+            position = self.grid._position(i)
+            if position is not None:
+                y, x = position
+                if top <= y < bottom and left <= x < right:
+                    lines.append((i, y, x))
+        return lines
+
+    def _cut_towards(self, y: int, x: int) -> None:
+        """Remove the lines of the neighbors of `(y, x)` that lead into it."""
+        for direction, (dy, dx) in OFFSETS.items():
+            ny, nx = y - dy, x - dx  # the neighbor pointing `direction` at us
+            if not (0 <= ny < self.grid.height and 0 <= nx < self.grid.width):
+                continue
+
+            i = self.grid._index(ny, nx)
+            bits = self._bits.get(i)
+            if bits is not None:
+                bits &= ~(0b111 << _slot(direction))
+                if bits & LINES:
+                    self._bits[i] = bits
+                else:
+                    del self._bits[i]
+                    del self._colors[i]
+
+    def resolve(self) -> None:
+        """Write the glyph of every line cell into the grid."""
+        made: dict[tuple[int, Optional[Color]], Junction] = {}
+        for i, bits in self._bits.items():
+            key = (bits, self._colors[i])
+            junction = made.get(key)
+            if junction is None:
+                junction = made[key] = Junction._from_mask(
+                    *resolve_bits(bits), self._colors[i]
+                )
+            self.grid._store(i, junction)
+
+        self.grid._changed()
@@ -0,0 +1,405 @@
+"""The junction table compiled into flat tuples.
+
+The constants at the bottom are generated from `junctions.json`, so importing
+this module doesn't read or parse any JSON. After editing the JSON, regenerate
+them with `python -m pyframe.border.junction_table`.
+"""
+
+from typing import Optional
+
+# Order of the directions in junctions.json and their shift in a junction mask
+DIRECTION_SHIFTS = (6, 4, 2, 0)  # up, down, left, right
+THICKNESS_NAMES = ("none", "thin", "thick", "double")
+
+GENERATED_MARKER = "# Generated by `write_module`, don't edit by hand.\n"
+
+
+def load_table() -> dict:
+    """Load `junctions.json`: TABLE[UP][DOWN][LEFT][RIGHT] -> Junction string"""
+    from importlib.resources import files
+    from json import loads
+
+    return loads(
+        files("pyframe.border").joinpath("junctions.json").read_text(encoding="utf-8")
+    )
+
+
+def compile_table(table: dict) -> tuple[tuple[str, ...], tuple[Optional[str], ...]]:
+    """Flatten the nested junction `table` into `(styles, glyphs)`.
+
+    `glyphs[style_index << 8 | mask]` is the junction string (or `None` if there
+    isn't one). The index after the last style is for styles not in the table.
+    """
+    styles = ["default"]
+    entries: dict[int, str | dict[str, str]] = {}
+
+    for up, downs in table.items():
+        for down, lefts in downs.items():
+            for left, rights in lefts.items():
+                for right, entry in rights.items():
+                    mask = 0
+                    for name, shift in zip((up, down, left, right), DIRECTION_SHIFTS):
+                        mask |= THICKNESS_NAMES.index(name) << shift
+                    entries[mask] = entry
+
+                    if isinstance(entry, dict):
+                        styles.extend(style for style in entry if style not in styles)
+
+    glyphs: list[Optional[str]] = [None] * ((len(styles) + 1) << 8)
+    for mask, entry in entries.items():
+        for style_index in range(len(styles) + 1):
+            if isinstance(entry, str):
+                glyphs[style_index << 8 | mask] = entry
+            elif style_index < len(styles):
+                glyphs[style_index << 8 | mask] = entry.get(styles[style_index])
+
+    return tuple(styles), tuple(glyphs)
+
+
+def write_module() -> None:
+    """Regenerate the constants of this module from `junctions.json`."""
+    styles, glyphs = compile_table(load_table())
+
+    lines = [GENERATED_MARKER, f"STYLES = {styles!r}\n", "GLYPHS = (\n"]
+    for i in range(0, len(glyphs), 8):
+        lines.append("    " + " ".join(f"{glyph!r}," for glyph in glyphs[i : i + 8]))
+        lines.append("\n")
+    lines.append(")\n")
+
+    path = __file__
+    with open(path, encoding="utf-8") as file:
+        source = file.read()
+
+    source = source[: source.index("\n" + GENERATED_MARKER) + 1]
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(source + "".join(lines))
+
+
+if __name__ == "__main__":
+    write_module()
+
+
+# Generated by `write_module`, don't edit by hand.
+STYLES = ('default', 'triple_dash', 'quad_dash', 'duo_dash', 'classic_dash', 'classic', 'round', 'sharp', 'dip_down')
+GLYPHS = (
+    None, '╶', '╺', ' ', '╴', '─', '╼', ' ',
+    '╸', '╾', '━', ' ', ' ', None, None, '═',
+    '╷', None, '┍', '╒', None, '┬', '┲', None,
+    '┑', '┭', '┯', None, '╕', None, None, '╤',
+    '╻', '┎', '┏', None, '┒', '┰', '┲', None,
+    '┓', '┱', '┳', None, None, None, None, None,
+    None, '╓', None, '╔', '╖', '╥', None, None,
+    None, None, None, None, '╗', None, None, '╦',
+    '╵', None, '┕', '╘', None, '┴', '┶', None,
+    '┙', '┵', '┷', None, '╛', None, None, '╧',
+    '│', '├', '┝', '╞', '┤', '┼', '┾', None,
+    '┥', '┽', '┿', None, '╡', None, None, '╪',
+    '╽', '┟', '┢', None, '┧', '╁', '╆', None,
+    '┪', '╅', '╈', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '╹', '┖', '┗', None, '┚', '┸', '┺', None,
+    '┛', '┹', '┻', None, None, None, None, None,
+    '╿', '┞', '┡', None, '┦', '╀', '╄', None,
+    '┩', '╃', '╇', None, None, None, None, None,
+    '┃', '┠', '┣', None, '┨', '╂', '╊', None,
+    '┫', '╉', '╋', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, '╙', None, '╚', '╜', '╨', None, None,
+    None, None, None, None, '╝', None, None, '╩',
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '║', '╟', None, '╠', '╢', '╫', None, None,
+    None, None, None, None, '╣', None, None, '╬',
+    None, '╶', '╺', ' ', '╴', '┄', '╼', ' ',
+    '╸', '╾', '┅', ' ', ' ', None, None, None,
+    '╷', None, '┍', '╒', None, '┬', '┲', None,
+    '┑', '┭', '┯', None, '╕', None, None, '╤',
+    '╻', '┎', '┏', None, '┒', '┰', '┲', None,
+    '┓', '┱', '┳', None, None, None, None, None,
+    None, '╓', None, '╔', '╖', '╥', None, None,
+    None, None, None, None, '╗', None, None, '╦',
+    '╵', None, '┕', '╘', None, '┴', '┶', None,
+    '┙', '┵', '┷', None, '╛', None, None, '╧',
+    '┆', '├', '┝', '╞', '┤', '┼', '┾', None,
+    '┥', '┽', '┿', None, '╡', None, None, '╪',
+    '╽', '┟', '┢', None, '┧', '╁', '╆', None,
+    '┪', '╅', '╈', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '╹', '┖', '┗', None, '┚', '┸', '┺', None,
+    '┛', '┹', '┻', None, None, None, None, None,
+    '╿', '┞', '┡', None, '┦', '╀', '╄', None,
+    '┩', '╃', '╇', None, None, None, None, None,
+    '┇', '┠', '┣', None, '┨', '╂', '╊', None,
+    '┫', '╉', '╋', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, '╙', None, '╚', '╜', '╨', None, None,
+    None, None, None, None, '╝', None, None, '╩',
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '║', '╟', None, '╠', '╢', '╫', None, None,
+    None, None, None, None, '╣', None, None, '╬',
+    None, '╶', '╺', ' ', '╴', '┈', '╼', ' ',
+    '╸', '╾', '┉', ' ', ' ', None, None, None,
+    '╷', None, '┍', '╒', None, '┬', '┲', None,
+    '┑', '┭', '┯', None, '╕', None, None, '╤',
+    '╻', '┎', '┏', None, '┒', '┰', '┲', None,
+    '┓', '┱', '┳', None, None, None, None, None,
+    None, '╓', None, '╔', '╖', '╥', None, None,
+    None, None, None, None, '╗', None, None, '╦',
+    '╵', None, '┕', '╘', None, '┴', '┶', None,
+    '┙', '┵', '┷', None, '╛', None, None, '╧',
+    '┊', '├', '┝', '╞', '┤', '┼', '┾', None,
+    '┥', '┽', '┿', None, '╡', None, None, '╪',
+    '╽', '┟', '┢', None, '┧', '╁', '╆', None,
+    '┪', '╅', '╈', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '╹', '┖', '┗', None, '┚', '┸', '┺', None,
+    '┛', '┹', '┻', None, None, None, None, None,
+    '╿', '┞', '┡', None, '┦', '╀', '╄', None,
+    '┩', '╃', '╇', None, None, None, None, None,
+    '┋', '┠', '┣', None, '┨', '╂', '╊', None,
+    '┫', '╉', '╋', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, '╙', None, '╚', '╜', '╨', None, None,
+    None, None, None, None, '╝', None, None, '╩',
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '║', '╟', None, '╠', '╢', '╫', None, None,
+    None, None, None, None, '╣', None, None, '╬',
+    None, '╶', '╺', ' ', '╴', '╌', '╼', ' ',
+    '╸', '╾', '╍', ' ', ' ', None, None, None,
+    '╷', None, '┍', '╒', None, '┬', '┲', None,
+    '┑', '┭', '┯', None, '╕', None, None, '╤',
+    '╻', '┎', '┏', None, '┒', '┰', '┲', None,
+    '┓', '┱', '┳', None, None, None, None, None,
+    None, '╓', None, '╔', '╖', '╥', None, None,
+    None, None, None, None, '╗', None, None, '╦',
+    '╵', None, '┕', '╘', None, '┴', '┶', None,
+    '┙', '┵', '┷', None, '╛', None, None, '╧',
+    '╎', '├', '┝', '╞', '┤', '┼', '┾', None,
+    '┥', '┽', '┿', None, '╡', None, None, '╪',
+    '╽', '┟', '┢', None, '┧', '╁', '╆', None,
+    '┪', '╅', '╈', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '╹', '┖', '┗', None, '┚', '┸', '┺', None,
+    '┛', '┹', '┻', None, None, None, None, None,
+    '╿', '┞', '┡', None, '┦', '╀', '╄', None,
+    '┩', '╃', '╇', None, None, None, None, None,
+    '╏', '┠', '┣', None, '┨', '╂', '╊', None,
+    '┫', '╉', '╋', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, '╙', None, '╚', '╜', '╨', None, None,
+    None, None, None, None, '╝', None, None, '╩',
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '║', '╟', None, '╠', '╢', '╫', None, None,
+    None, None, None, None, '╣', None, None, '╬',
+    None, '╶', '╺', ' ', '╴', '-', '╼', ' ',
+    '╸', '╾', None, ' ', ' ', None, None, None,
+    '╷', None, '┍', '╒', None, '┬', '┲', None,
+    '┑', '┭', '┯', None, '╕', None, None, '╤',
+    '╻', '┎', '┏', None, '┒', '┰', '┲', None,
+    '┓', '┱', '┳', None, None, None, None, None,
+    None, '╓', None, '╔', '╖', '╥', None, None,
+    None, None, None, None, '╗', None, None, '╦',
+    '╵', None, '┕', '╘', None, '┴', '┶', None,
+    '┙', '┵', '┷', None, '╛', None, None, '╧',
+    '|', '├', '┝', '╞', '┤', '┼', '┾', None,
+    '┥', '┽', '┿', None, '╡', None, None, '╪',
+    '╽', '┟', '┢', None, '┧', '╁', '╆', None,
+    '┪', '╅', '╈', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '╹', '┖', '┗', None, '┚', '┸', '┺', None,
+    '┛', '┹', '┻', None, None, None, None, None,
+    '╿', '┞', '┡', None, '┦', '╀', '╄', None,
+    '┩', '╃', '╇', None, None, None, None, None,
+    None, '┠', '┣', None, '┨', '╂', '╊', None,
+    '┫', '╉', '╋', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, '╙', None, '╚', '╜', '╨', None, None,
+    None, None, None, None, '╝', None, None, '╩',
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '║', '╟', None, '╠', '╢', '╫', None, None,
+    None, None, None, None, '╣', None, None, '╬',
+    None, '╶', '╺', ' ', '╴', None, '╼', ' ',
+    '╸', '╾', None, ' ', ' ', None, None, '=',
+    '╷', None, '┍', '╒', None, '┬', '┲', None,
+    '┑', '┭', '┯', None, '╕', None, None, '╤',
+    '╻', '┎', '┏', None, '┒', '┰', '┲', None,
+    '┓', '┱', '┳', None, None, None, None, None,
+    None, '╓', None, '╔', '╖', '╥', None, None,
+    None, None, None, None, '╗', None, None, '╦',
+    '╵', None, '┕', '╘', None, '┴', '┶', None,
+    '┙', '┵', '┷', None, '╛', None, None, '╧',
+    '|', '├', '┝', '╞', '┤', '┼', '┾', None,
+    '┥', '┽', '┿', None, '╡', None, None, '╪',
+    '╽', '┟', '┢', None, '┧', '╁', '╆', None,
+    '┪', '╅', '╈', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '╹', '┖', '┗', None, '┚', '┸', '┺', None,
+    '┛', '┹', '┻', None, None, None, None, None,
+    '╿', '┞', '┡', None, '┦', '╀', '╄', None,
+    '┩', '╃', '╇', None, None, None, None, None,
+    None, '┠', '┣', None, '┨', '╂', '╊', None,
+    '┫', '╉', '╋', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, '╙', None, '╚', '╜', '╨', None, None,
+    None, None, None, None, '╝', None, None, '╩',
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '║', '╟', None, '╠', '╢', '╫', None, None,
+    None, None, None, None, '╣', None, None, '╬',
+    None, '╶', '╺', ' ', '╴', None, '╼', ' ',
+    '╸', '╾', None, ' ', ' ', None, None, None,
+    '╷', '╭', '┍', '╒', '╮', '┬', '┲', None,
+    '┑', '┭', '┯', None, '╕', None, None, '╤',
+    '╻', '┎', '┏', None, '┒', '┰', '┲', None,
+    '┓', '┱', '┳', None, None, None, None, None,
+    None, '╓', None, '╔', '╖', '╥', None, None,
+    None, None, None, None, '╗', None, None, '╦',
+    '╵', '╰', '┕', '╘', '╯', '┴', '┶', None,
+    '┙', '┵', '┷', None, '╛', None, None, '╧',
+    None, '├', '┝', '╞', '┤', '┼', '┾', None,
+    '┥', '┽', '┿', None, '╡', None, None, '╪',
+    '╽', '┟', '┢', None, '┧', '╁', '╆', None,
+    '┪', '╅', '╈', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '╹', '┖', '┗', None, '┚', '┸', '┺', None,
+    '┛', '┹', '┻', None, None, None, None, None,
+    '╿', '┞', '┡', None, '┦', '╀', '╄', None,
+    '┩', '╃', '╇', None, None, None, None, None,
+    None, '┠', '┣', None, '┨', '╂', '╊', None,
+    '┫', '╉', '╋', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, '╙', None, '╚', '╜', '╨', None, None,
+    None, None, None, None, '╝', None, None, '╩',
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '║', '╟', None, '╠', '╢', '╫', None, None,
+    None, None, None, None, '╣', None, None, '╬',
+    None, '╶', '╺', ' ', '╴', None, '╼', ' ',
+    '╸', '╾', None, ' ', ' ', None, None, None,
+    '╷', '┌', '┍', '╒', '┐', '┬', '┲', None,
+    '┑', '┭', '┯', None, '╕', None, None, '╤',
+    '╻', '┎', '┏', None, '┒', '┰', '┲', None,
+    '┓', '┱', '┳', None, None, None, None, None,
+    None, '╓', None, '╔', '╖', '╥', None, None,
+    None, None, None, None, '╗', None, None, '╦',
+    '╵', '└', '┕', '╘', '┘', '┴', '┶', None,
+    '┙', '┵', '┷', None, '╛', None, None, '╧',
+    None, '├', '┝', '╞', '┤', '┼', '┾', None,
+    '┥', '┽', '┿', None, '╡', None, None, '╪',
+    '╽', '┟', '┢', None, '┧', '╁', '╆', None,
+    '┪', '╅', '╈', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '╹', '┖', '┗', None, '┚', '┸', '┺', None,
+    '┛', '┹', '┻', None, None, None, None, None,
+    '╿', '┞', '┡', None, '┦', '╀', '╄', None,
+    '┩', '╃', '╇', None, None, None, None, None,
+    None, '┠', '┣', None, '┨', '╂', '╊', None,
+    '┫', '╉', '╋', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, '╙', None, '╚', '╜', '╨', None, None,
+    None, None, None, None, '╝', None, None, '╩',
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '║', '╟', None, '╠', '╢', '╫', None, None,
+    None, None, None, None, '╣', None, None, '╬',
+    None, '╶', '╺', ' ', '╴', '⍽', '╼', ' ',
+    '╸', '╾', None, ' ', ' ', None, None, None,
+    '╷', None, '┍', '╒', None, '┬', '┲', None,
+    '┑', '┭', '┯', None, '╕', None, None, '╤',
+    '╻', '┎', '┏', None, '┒', '┰', '┲', None,
+    '┓', '┱', '┳', None, None, None, None, None,
+    None, '╓', None, '╔', '╖', '╥', None, None,
+    None, None, None, None, '╗', None, None, '╦',
+    '╵', None, '┕', '╘', None, '┴', '┶', None,
+    '┙', '┵', '┷', None, '╛', None, None, '╧',
+    None, '├', '┝', '╞', '┤', '┼', '┾', None,
+    '┥', '┽', '┿', None, '╡', None, None, '╪',
+    '╽', '┟', '┢', None, '┧', '╁', '╆', None,
+    '┪', '╅', '╈', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '╹', '┖', '┗', None, '┚', '┸', '┺', None,
+    '┛', '┹', '┻', None, None, None, None, None,
+    '╿', '┞', '┡', None, '┦', '╀', '╄', None,
+    '┩', '╃', '╇', None, None, None, None, None,
+    None, '┠', '┣', None, '┨', '╂', '╊', None,
+    '┫', '╉', '╋', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, '╙', None, '╚', '╜', '╨', None, None,
+    None, None, None, None, '╝', None, None, '╩',
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '║', '╟', None, '╠', '╢', '╫', None, None,
+    None, None, None, None, '╣', None, None, '╬',
+    None, '╶', '╺', ' ', '╴', None, '╼', ' ',
+    '╸', '╾', None, ' ', ' ', None, None, None,
+    '╷', None, '┍', '╒', None, '┬', '┲', None,
+    '┑', '┭', '┯', None, '╕', None, None, '╤',
+    '╻', '┎', '┏', None, '┒', '┰', '┲', None,
+    '┓', '┱', '┳', None, None, None, None, None,
+    None, '╓', None, '╔', '╖', '╥', None, None,
+    None, None, None, None, '╗', None, None, '╦',
+    '╵', None, '┕', '╘', None, '┴', '┶', None,
+    '┙', '┵', '┷', None, '╛', None, None, '╧',
+    None, '├', '┝', '╞', '┤', '┼', '┾', None,
+    '┥', '┽', '┿', None, '╡', None, None, '╪',
+    '╽', '┟', '┢', None, '┧', '╁', '╆', None,
+    '┪', '╅', '╈', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '╹', '┖', '┗', None, '┚', '┸', '┺', None,
+    '┛', '┹', '┻', None, None, None, None, None,
+    '╿', '┞', '┡', None, '┦', '╀', '╄', None,
+    '┩', '╃', '╇', None, None, None, None, None,
+    None, '┠', '┣', None, '┨', '╂', '╊', None,
+    '┫', '╉', '╋', None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, '╙', None, '╚', '╜', '╨', None, None,
+    None, None, None, None, '╝', None, None, '╩',
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None,
+    '║', '╟', None, '╠', '╢', '╫', None, None,
+    None, None, None, None, '╣', None, None, '╬',
+)
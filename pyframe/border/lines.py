@@ -0,0 +1,115 @@
+from typing import Optional, Sequence
+
+from pyframe.border.junction import (
+    GLYPHS,
+    SHIFTS,
+    STYLE_INDEXES,
+    THICKNESS_CODES,
+    Junction,
+    merge_masks,
+)
+from pyframe.colors import Color
+from pyframe.grid import Grid
+from pyframe.types_ import Direction, Thickness
+from pyframe.vector import VectorLike, VectorYX
+
+OPPOSITES = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT,
+}
+
+
+def _direction(dy: int, dx: int) -> Direction:
+    if dy:
+        return Direction.DOWN if dy > 0 else Direction.UP
+    return Direction.RIGHT if dx > 0 else Direction.LEFT
+
+
+def _style_for(mask: int, *styles: str) -> str:
+    """The first of `styles` that has a glyph for `mask`, otherwise `"default"` or
+    `"sharp"` (thin corners aren't in the default style).
+    """
+    for fallback in (*styles, "default", "sharp"):
+        if GLYPHS[STYLE_INDEXES.get(fallback, len(STYLE_INDEXES)) << 8 | mask]:
+            return fallback
+    return styles[0]  # let `Junction` raise
+
+
+def draw_path(
+    grid: Grid,
+    points: Sequence[VectorLike],
+    thickness: Thickness = Thickness.THIN,
+    style: str = "default",
+    color: Optional[Color] = None,
+    closed: bool = False,
+) -> None:
+    """Draw a line through `points` onto `grid`, joining the junctions it meets.
+
+    Each part of the path has to be horizontal or vertical. The ends of an open
+    path that meet a junction only lead into the path (making `├`, `┬`, ...),
+    otherwise they are whole lines.
+    """
+    points = [VectorYX(point) for point in points]
+    if closed and points:
+        points.append(points[0])
+
+    code = THICKNESS_CODES[thickness]
+
+    # The mask of each cell, in the order the path goes through them
+    masks: dict[tuple[int, int], int] = {}
+    for (y, x), (end_y, end_x) in zip(points, points[1:]):
+        if y != end_y and x != end_x:
+            raise ValueError("lines have to be horizontal or vertical")
+
+        dy, dx = (end_y > y) - (end_y < y), (end_x > x) - (end_x < x)
+        if not (dy or dx):
+            continue
+
+        forward = code << SHIFTS[_direction(dy, dx)]
+        backward = code << SHIFTS[_direction(-dy, -dx)]
+
+        masks[y, x] = masks.get((y, x), 0) | forward
+        for _ in range(max(abs(end_y - y), abs(end_x - x)) - 1):
+            y, x = y + dy, x + dx
+            masks[y, x] = masks.get((y, x), 0) | forward | backward
+        masks[end_y, end_x] = masks.get((end_y, end_x), 0) | backward
+
+    # Check the whole path fits before drawing any of it (`_index` would wrap
+    # negative coordinates around)
+    for y, x in masks:
+        if not (0 <= y < grid.height and 0 <= x < grid.width):
+            raise IndexError("line doesn't fit in the grid")
+    indexes = [grid._index(y, x) for y, x in masks]
+
+    ends = set() if closed or not masks else {points[0], points[-1]}
+    made: dict[int, Junction] = {}
+    for ((y, x), mask), i in zip(masks.items(), indexes):
+        existing = grid._objects.get(i)
+        if not isinstance(existing, Junction):
+            existing = None
+
+        if existing is not None:
+            mask = merge_masks(existing._mask, mask)
+            grid._store(
+                i,
+                Junction._from_mask(
+                    mask, _style_for(mask, style, existing.style), color
+                ),
+            )
+            continue
+
+        if (y, x) in ends:
+            for direction, shift in SHIFTS.items():
+                if mask >> shift & 0b11:  # the end of a line, make it whole
+                    mask |= code << SHIFTS[OPPOSITES[direction]]
+
+        junction = made.get(mask)
+        if junction is None:
+            junction = made[mask] = Junction._from_mask(
+                mask, _style_for(mask, style), color
+            )
+        grid._store(i, junction)
+
+    grid._changed()
@@ -1,5 +1,63 @@
+from enum import Enum
 from typing import Self
 
+RESET = "\033[0m"
+DEFAULT_BACKGROUND = "\033[49m"
+
+
+class ColorDepth(Enum):
+    """The amount of colors a terminal can show."""
+
+    TRUECOLOR = 0
+    ANSI256 = 1
+    ANSI16 = 2
+
+
+# xterm's default values for the 16 basic colors
+ANSI16_RGB = (
+    (0, 0, 0),
+    (205, 0, 0),
+    (0, 205, 0),
+    (205, 205, 0),
+    (0, 0, 238),
+    (205, 0, 205),
+    (0, 205, 205),
+    (229, 229, 229),
+    (127, 127, 127),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (92, 92, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+)
+
+# Levels of each channel in the 6x6x6 color cube of the 256 colors
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+
+def _distance(a: tuple[int, ...], b: tuple[int, ...]) -> int:
+    return sum((x - y) ** 2 for x, y in zip(a, b))
+
+
+def nearest_ansi16(rgb: tuple[int, ...]) -> int:
+    """Get the index of the closest of the 16 basic colors."""
+    return min(range(16), key=lambda i: _distance(rgb, ANSI16_RGB[i]))
+
+
+def nearest_ansi256(rgb: tuple[int, ...]) -> int:
+    """Get the index of the closest color in the 6x6x6 cube or the grayscale ramp."""
+    cube = [min(range(6), key=lambda i: abs(CUBE_LEVELS[i] - x)) for x in rgb]
+    cube_rgb = tuple(CUBE_LEVELS[i] for i in cube)
+
+    gray = min(max(round((sum(rgb) / 3 - 8) / 10), 0), 23)
+    gray_rgb = (8 + gray * 10,) * 3
+
+    if _distance(rgb, gray_rgb) < _distance(rgb, cube_rgb):
+        return 232 + gray
+    return 16 + cube[0] * 36 + cube[1] * 6 + cube[2]
+
 
 class Color:
     @classmethod
@@ -19,6 +77,15 @@ class Color:
         self._rgb = rgb
         self.name = name
 
+        self._sgr = f"\033[38;2;{';'.join([str(x) for x in rgb])}m"
+        self._background_sgr = f"\033[48;2;{';'.join([str(x) for x in rgb])}m"
+
+        # (depth, background) -> escape code
+        self._depth_sgrs: dict[tuple[ColorDepth, bool], str] = {
+            (ColorDepth.TRUECOLOR, False): self._sgr,
+            (ColorDepth.TRUECOLOR, True): self._background_sgr,
+        }
+
     @property
     def hex(self):
         return self._hex
@@ -39,6 +106,35 @@ class Color:
     def b(self):
         return self._rgb[2]
 
+    @property
+    def sgr(self) -> str:
+        """The escape code that sets the text color to this color."""
+        return self._sgr
+
+    @property
+    def background_sgr(self) -> str:
+        """The escape code that sets the background color to this color."""
+        return self._background_sgr
+
+    def depth_sgr(self, depth: ColorDepth, background: bool = False) -> str:
+        """The escape code of the closest color a terminal with `depth` can show.
+
+        The closest color is only looked up the first time.
+        """
+        sgr = self._depth_sgrs.get((depth, background))
+        if sgr is not None:
+            return sgr
+
+        if depth == ColorDepth.ANSI256:
+            sgr = f"\033[{48 if background else 38};5;{nearest_ansi256(self.rgb)}m"
+        else:
+            index = nearest_ansi16(self.rgb)
+            code = (30 if index < 8 else 82) + index
+            sgr = f"\033[{code + 10 if background else code}m"
+
+        self._depth_sgrs[(depth, background)] = sgr
+        return sgr
+
 
 class Colors:
     BLACK = Color.from_hex("BLACK", "#090300")
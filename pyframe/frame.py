@@ -1,10 +1,13 @@
-from dataclasses import dataclass
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from math import ceil
-from typing import Self
+from typing import Callable, Iterator, Optional, Self
 
-from pyframe.border.border_type import Border, BorderPattern, BorderType
+from pyframe.border.border_type import BorderGlyphs, BorderPattern, BorderType
 from pyframe.border.border_types import Borders
-from pyframe.border.junction import Junction
+from pyframe.border.junction import SHIFTS, Junction
+from pyframe.border.lines import _style_for
 from pyframe.colors import Color, Colors
 from pyframe.grid import Cell, Grid
 from pyframe.types_ import Alignment, Direction, TitleSide
@@ -61,7 +64,173 @@ def rect_range(stop, start=None) -> list[tuple[int, int]]:
     ]
 
 
+# Top, left, bottom, right coordinates of a border
+Ring = tuple[int, int, int, int]
+
+
+def ring_edges(ring: Ring) -> tuple[Ring, Ring, Ring, Ring]:
+    """The top, bottom, left and right edges of `ring`, as degenerate rings."""
+    top, left, bottom, right = ring
+    return (
+        (top, left, top, right),
+        (bottom, left, bottom, right),
+        (top, left, bottom, left),
+        (top, right, bottom, right),
+    )
+
+
+def rect_intersection(rect: Ring, other: Ring) -> Optional[Ring]:
+    """The overlap of two rectangles given like rings, if they overlap."""
+    top, left = max(rect[0], other[0]), max(rect[1], other[1])
+    bottom, right = min(rect[2], other[2]), min(rect[3], other[3])
+    if top > bottom or left > right:
+        return None
+    return top, left, bottom, right
+
+
+def merge_frame(
+    grid: Grid,
+    frame: Grid,
+    pos: tuple[int, int],
+    clip: Optional[Ring] = None,
+) -> None:
+    """Overlay `frame` on `grid` at `pos`, merging the junctions where borders meet.
+
+    If `clip` is given, only the cells inside of it are drawn.
+    """
+    pos_y, pos_x = pos
+    bottom, right = frame.height - 1, frame.width - 1
+
+    # Junctions can only merge where the edge of `frame` meets a junction already
+    # in `grid` (of a border, a line drawn with `hline`, `Junction.parse_grid`,
+    # ...). The cell objects of the edges are looked up a row or column at a
+    # time, which costs the length of the edges or the amount of objects in
+    # `grid`, whichever is less.
+    frame_ring = (pos_y, pos_x, pos_y + bottom, pos_x + right)
+    points: set[tuple[int, int]] = set()
+    for edge in ring_edges(frame_ring):
+        edge = rect_intersection(edge, (0, 0, grid.height - 1, grid.width - 1))
+        if edge is not None:
+            top, left, edge_bottom, edge_right = edge
+            points.update(
+                (y, x)
+                for _, y, x in grid._objects_in(
+                    (top, left), edge_bottom - top + 1, edge_right - left + 1
+                )
+            )
+
+    junctions: list[tuple[Junction, tuple[int, int]]] = []
+    bounds = clip or (0, 0, grid.height - 1, grid.width - 1)
+    for y, x in points:
+        if not (bounds[0] <= y <= bounds[2] and bounds[1] <= x <= bounds[3]):
+            continue  # clipped off, or a border sticking out of `grid`
+
+        grid_junction = grid._objects.get(grid._index(y, x))
+        frame_junction = frame._objects.get(frame._index(y - pos_y, x - pos_x))
+
+        if not isinstance(grid_junction, Junction) or not isinstance(
+            frame_junction, Junction
+        ):
+            continue
+
+        junction = grid_junction + frame_junction
+        if 0 < x - pos_x < right:
+            junction = junction.without(Direction.DOWN if y == pos_y else Direction.UP)
+        elif 0 < y - pos_y < bottom:
+            junction = junction.without(
+                Direction.RIGHT if x == pos_x else Direction.LEFT
+            )
+        junctions.append((junction, (y, x)))
+
+    if clip is None:
+        grid.overlay_from_top_left(frame, pos)
+    else:
+        region = rect_intersection(frame_ring, clip)
+        if region is not None:
+            grid[region[:2] : region[2:]]._copy_region(
+                frame, (region[0] - pos_y, region[1] - pos_x)
+            )
+
+    for junction, coord in junctions:
+        grid[coord] = junction
+
+
+@dataclass
+class Placement:
+    """Where a retained frame is drawn on its parent."""
+
+    frame: "Frame"
+    pos: tuple[int, int]
+    z: int = 0
+    change_border_color: bool = False
+
+    # Where the frame was drawn by the last rendering
+    drawn: Optional[Ring] = field(default=None, repr=False)
+
+    @property
+    def rect(self) -> Ring:
+        top, left = self.pos
+        return top, left, top + self.frame.height - 1, left + self.frame.width - 1
+
+
+class PrototypeCache:
+    """A bounded LRU of frames that get cloned instead of built again.
+
+    ```
+    Frame.prototypes.maxsize = 1024
+    print(Frame.prototypes.hits, Frame.prototypes.misses)
+    ```
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        # key -> (border type, its glyphs when the prototype was made, prototype)
+        self._prototypes: OrderedDict[
+            tuple, tuple[BorderType, BorderGlyphs, "Frame"]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._prototypes)
+
+    def clear(self) -> None:
+        self._prototypes.clear()
+        self.hits = self.misses = 0
+
+    def get(
+        self, key: tuple, border_type: BorderType, build: Callable[[], "Frame"]
+    ) -> "Frame":
+        """A clone of the prototype for `key` and `border_type`, built if needed."""
+        key = (*key, id(border_type))
+        entry = self._prototypes.get(key)
+
+        # A border type that changed since (or a new one with the same id)
+        # compiles to other glyphs
+        if (
+            entry is not None
+            and entry[0] is border_type
+            and entry[1] is border_type.glyphs()
+        ):
+            self.hits += 1
+            self._prototypes.move_to_end(key)
+            return entry[2].clone()
+
+        self.misses += 1
+        prototype = build()
+        if self.maxsize > 0:
+            self._prototypes[key] = (border_type, border_type.glyphs(), prototype)
+            while len(self._prototypes) > self.maxsize:
+                self._prototypes.popitem(last=False)
+
+        return prototype.clone()
+
+
 class Frame(Grid):
+    # Prototypes of `empty_box` and `map_text` frames
+    prototypes = PrototypeCache()
+
     @classmethod
     def empty_box(
         cls,
@@ -70,14 +239,23 @@ class Frame(Grid):
         border_type: BorderType = Borders.Thin.ROUND,
     ) -> "Frame":
         """Includes border"""
-        frame = Frame(
-            [[Cell(" ") for _ in range(width - 2)] for _ in range(height - 2)],
+        return Frame.prototypes.get(
+            (Frame, height, width),
             border_type,
+            lambda: Frame._build_empty_box(height, width, border_type),
         )
-        if height == 2:
-            frame.width = width - 2
-            frame.border()
 
+    @staticmethod
+    def _build_empty_box(height: int, width: int, border_type: BorderType) -> "Frame":
+        if height < 2 or width < 2:
+            return Frame(Grid.empty(max(height - 2, 0), 0), border_type)
+
+        # Allocate the border along with the content, instead of moving the
+        # content into a bigger grid (this also borders boxes with no inside)
+        frame = Frame(Grid.empty(0, 0), border_type)
+        frame._adopt(Grid.empty(height, width)[(1, 1) : (height - 2, width - 2)])
+        frame._ring_reserved = True
+        frame.border()
         return frame
 
     @classmethod
@@ -86,10 +264,69 @@ class Frame(Grid):
         text: str,
         border_type: BorderType = Borders.Thin.ROUND,
     ) -> Self:
-        return cls(
-            [[Cell(char) for char in row] for row in text.splitlines()], border_type
+        lines = text.splitlines()
+        width = max(map(len, lines), default=0)
+
+        return Frame.prototypes.get(
+            (cls, "map_text", text),
+            border_type,
+            lambda: cls(
+                Grid.from_rows(
+                    [[Cell(char) for char in line.ljust(width)] for line in lines],
+                    width,
+                    trusted=True,
+                ),
+                border_type,
+            ),
         )
 
+    def clone(self) -> Self:
+        """A copy of the frame with its own cells, titles and retained frames.
+
+        The cells are copied as whole arrays when the frame isn't a view.
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+
+        if (
+            self._offset == 0
+            and self._stride == self.width
+            and len(self._chars) == self.height * self.width
+        ):
+            clone._chars = self._chars[:]
+            clone._colors = self._colors[:]
+            clone._backgrounds = self._backgrounds[:]
+            clone._objects = self._objects.copy()
+        else:
+            clone._adopt(self.copy())
+            clone._ring_reserved = False
+
+        clone.titles = self.titles.copy()
+
+        clone._rendered = None
+        clone._damage = []
+
+        clone.children = []
+        clone.parents = []
+        clone.placements = []
+        # The retained frames are cloned too (once each, if placed more than once)
+        frames: dict[int, Frame] = {}
+        for placement in self.placements:
+            frame = frames.get(id(placement.frame))
+            if frame is None:
+                frame = frames[id(placement.frame)] = placement.frame.clone()
+            clone.add_frame(
+                frame,
+                placement.pos,
+                placement.change_border_color,
+                retained=True,
+                z=placement.z,
+            )
+
+        clone._batch_depth = 0
+        clone._flush_batch()
+        return clone
+
     @overload
     def __init__(self, grid: Grid, border_type: BorderType = Borders.Thin.ROUND, /): ...
 
@@ -106,59 +343,113 @@ class Frame(Grid):
         cells: list[list[Cell]] | Grid,
         border_type: BorderType = Borders.Thin.ROUND,
     ) -> None:
-        if isinstance(cells, Grid):
-            cells = cells._cells
+        self.children = []
+        self.parents = []
 
-        super().__init__(cells)
+        # Frames drawn on this one when rendering, the cached rendering and the
+        # parts of it that are outdated
+        self.placements: list[Placement] = []
+        self._rendered: Optional[Grid] = None
+        self._damage: list[Ring] = []
+
+        if isinstance(cells, Grid):
+            self._adopt(cells)
+        else:
+            super().__init__(cells)
 
         self.titles: list[Title] = []
 
+        # Border and title passes waiting for the end of a `batch`
+        self._batch_depth = 0
+        self._pending_border_color = False
+        self._pending_titles = False
+
         self.border_type = border_type
         self.border_color = None
         self.left_title_color = None
         self.right_title_color = None
         self.base_color = None
 
+        self.bordered = False
+        # Whether the cells around the frame are free for its border
+        self._ring_reserved = False
+
         if self.width != 0:
             self.border()
 
-        self.children = []
-        self.parents = []
-
     def color_inner(self, color: Color):
         self.base_color = color
-        self.color(self.base_color, rect_range(VectorYX(self.size) - 2, (1, 1)))
+        self.color_rect(((1, 1), VectorYX(self.size) - 2), self.base_color)
 
     def color_border(self, color: Color):
         self.border_color = color
-        self.color(self.border_color, self.border_coords)
+        self._recolor_border()
+        self._redraw_titles()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Color the border and draw the titles once at the end, instead of after
+        every change.
+
+        ```
+        with frame.batch():
+            for title in titles:
+                frame.add_title(title)
+        ```
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._flush_batch()
+
+    def _recolor_border(self) -> None:
+        if self._batch_depth:
+            self._pending_border_color = True
+        else:
+            self._color_border_of(self)
+
+    def _redraw_titles(self) -> None:
+        if self._batch_depth:
+            self._pending_titles = True
+        else:
+            self._add_titles()
+
+    def _flush_batch(self) -> None:
+        if self._pending_border_color:
+            self._pending_border_color = False
+            self._color_border_of(self)
+
+        if self._pending_titles:
+            self._pending_titles = False
+            self._add_titles()
+
+    def _color_border_of(self, grid: Grid, clip: Optional[Ring] = None) -> None:
+        for edge in ring_edges((0, 0, self.height - 1, self.width - 1)):
+            if clip is not None:
+                edge = rect_intersection(edge, clip)
+                if edge is None:
+                    continue
 
-        self._add_titles()
+            grid.color_rect((edge[:2], edge[2:]), self.border_color)
 
-    def _add_titles(self):
-        for title in self.titles:
-            title_right = (
-                self.border_type.title_right_top
-                if title.title_side == TitleSide.TOP
-                else self.border_type.title_right_bottom
-            )
-            title_left = (
-                self.border_type.title_left_top
-                if title.title_side == TitleSide.TOP
-                else self.border_type.title_left_bottom
-            )
-            title_right = (
-                title_right if isinstance(title_right, str) else title_right.value
-            )
-            title_left = title_left if isinstance(title_left, str) else title_left.value
+    def _add_titles(self, grid: Optional[Grid] = None):
+        """Draw the titles on this frame, or on `grid` (a rendering of it)."""
+        if not self.bordered:
+            return  # they're drawn on the border when it's back
 
-            matrix = Grid(
-                [
-                    [Cell(title_left, color=self.border_color)]
-                    + [Cell(cell, color=title.color) for cell in title.title]
-                    + [Cell(title_right, color=self.border_color)]
-                ]
-            )
+        if grid is None:
+            grid = self
+
+        glyphs = self.border_type.glyphs()
+        for title in self.titles:
+            if title.title_side == TitleSide.TOP:
+                title_left, title_right = glyphs.title_left_top, glyphs.title_right_top
+            else:
+                title_left = glyphs.title_left_bottom
+                title_right = glyphs.title_right_bottom
 
             pos = convert_align_to_pos(
                 title.alignment,
@@ -173,68 +464,87 @@ class Frame(Grid):
 
             start_pos = pos - 1
 
-            if title.title_side == TitleSide.LEFT:
-                self[(start_pos, 0):] = Grid(list(map(list, zip(*matrix._cells))))
-            elif title.title_side == TitleSide.RIGHT:
-                self[(start_pos, self.width - 1) :] = Grid(
-                    list(map(list, zip(*matrix._cells)))
+            if title.title_side in [TitleSide.LEFT, TitleSide.RIGHT]:
+                x = 0 if title.title_side == TitleSide.LEFT else self.width - 1
+                cells = (
+                    [Cell(title_left, color=self.border_color)]
+                    + [Cell(cell, color=title.color) for cell in title.title]
+                    + [Cell(title_right, color=self.border_color)]
+                )
+                for y, cell in enumerate(cells, start_pos):
+                    if 0 <= y < self.height:
+                        grid[(y, x)] = cell
+            else:
+                y = 0 if title.title_side == TitleSide.TOP else self.height - 1
+                grid.write_text((y, start_pos), title_left, self.border_color)
+                grid.write_text((y, start_pos + 1), title.title, title.color)
+                grid.write_text(
+                    (y, start_pos + 1 + len(title.title)),
+                    title_right,
+                    self.border_color,
                 )
-            elif title.title_side == TitleSide.TOP:
-                self[(0, start_pos):] = matrix
-            elif title.title_side == TitleSide.BOTTOM:
-                self[(self.height - 1, start_pos) :] = matrix
 
     def unborder(self):
         """Remove the border."""
-        self._cells = self[(1, 1) : VectorYX(self.size) - 2]._cells
+        self._adopt(self[(1, 1) : VectorYX(self.size) - 2])
+        self.bordered = False
+        self._ring_reserved = True  # for `border` to put the border back in
+        self._pending_border_color = self._pending_titles = False
+        self.invalidate()
 
     def add_title(self, title: Title) -> None:  # make titles better
         self.titles.append(title)
 
-        self._add_titles()  # maybe separate construct function?
+        self._redraw_titles()  # maybe separate construct function?
 
     def border(self):
         """Add a border around the Matrix."""
-        border = Border(self.border_type)
-
-        top_row = [
-            border.top_right,
-            *(border.top_horizontal * self.width),
-            border.top_left,
-        ]
-
-        left_column = border.left_vertical * self.height
-        right_column = border.right_vertical * self.height
-
-        bottom_row = [
-            border.bottom_right,
-            *(border.bottom_horizontal * self.width),
-            border.bottom_left,
-        ]
-
-        for i, row in enumerate(self._cells):
-            row.insert(0, left_column[i])
-            row.append(right_column[i])
-
-        self._cells.append(bottom_row)
-        self._cells.insert(0, top_row)
-
-        self.height += 2
-        self.width += 2
-
-        self.top_coords = [(0, i) for i in range(1, self.width - 1)]
-        self.bottom_coords = [(self.height - 1, i) for i in range(1, self.width - 1)]
-        self.left_coords = [(i, 0) for i in range(1, self.height - 1)]
-        self.right_coords = [(i, self.width - 1) for i in range(1, self.height - 1)]
-
-        self.corner_coords = [
+        if self._ring_reserved:
+            # The cells around the content are left over from `unborder`, so
+            # the content stays where it is
+            self._offset -= self._stride + 1
+            self.height += 2
+            self.width += 2
+            self._ring_reserved = False
+        else:
+            inner = Grid.__new__(Grid)
+            inner._adopt(self)
+
+            self._allocate(self.height + 2, self.width + 2)
+            self._copy_region(inner, (0, 0), (1, 1))
+
+        self.bordered = True
+
+        self._draw_border()
+
+    @property
+    def top_coords(self) -> list[tuple[int, int]]:
+        return [(0, i) for i in range(1, self.width - 1)]
+
+    @property
+    def bottom_coords(self) -> list[tuple[int, int]]:
+        return [(self.height - 1, i) for i in range(1, self.width - 1)]
+
+    @property
+    def left_coords(self) -> list[tuple[int, int]]:
+        return [(i, 0) for i in range(1, self.height - 1)]
+
+    @property
+    def right_coords(self) -> list[tuple[int, int]]:
+        return [(i, self.width - 1) for i in range(1, self.height - 1)]
+
+    @property
+    def corner_coords(self) -> list[tuple[int, int]]:
+        return [
             (0, 0),
             (0, self.width - 1),
             (self.height - 1, 0),
             (self.height - 1, self.width - 1),
         ]
 
-        self.border_coords = [
+    @property
+    def border_coords(self) -> list[tuple[int, int]]:
+        return [
             *self.top_coords,
             *self.bottom_coords,
             *self.left_coords,
@@ -242,54 +552,215 @@ class Frame(Grid):
             *self.corner_coords,
         ]
 
-        self._add_titles()
+    def set_border_type(self, border_type: BorderType) -> None:
+        """Change the border type, only redrawing the border.
+
+        Lines of frames added onto the border still meet it after.
+        """
+        self.border_type = border_type
+        if not self.bordered:
+            return
+
+        junctions = []
+        for top, left, bottom, right in ring_edges(
+            (0, 0, self.height - 1, self.width - 1)
+        ):
+            junctions.extend(
+                (i, self._objects[i])
+                for i, _, _ in self._objects_in(
+                    (top, left), bottom - top + 1, right - left + 1
+                )
+            )
+        self._draw_border()
+
+        # Keep the lines of the old junctions that the new border doesn't have
+        for i, old in junctions:
+            new = self._objects.get(i)
+            if not isinstance(old, Junction) or not isinstance(new, Junction):
+                continue  # a title
+            extra = old._mask
+            for shift in SHIFTS.values():
+                if new._mask >> shift & 0b11:
+                    extra &= ~(0b11 << shift)
+            if extra:
+                mask = new._mask | extra
+                self._store(
+                    i, Junction._from_mask(mask, _style_for(mask, new.style), new.color)
+                )
+
+    def _draw_border(self) -> None:
+        """Draw the border, with its color and titles, on the outer cells."""
+        glyphs = self.border_type.glyphs()
+        inner_height, inner_width = self.height - 2, self.width - 2
+
+        self._write_cells(0, 0, glyphs.top_row(inner_width, self.border_color))
+        self._write_cells(
+            self.height - 1, 0, glyphs.bottom_row(inner_width, self.border_color)
+        )
+        if inner_height > 0:
+            self._write_cells(
+                1, 0, glyphs.left_column(inner_height, self.border_color), True
+            )
+            self._write_cells(
+                1,
+                self.width - 1,
+                glyphs.right_column(inner_height, self.border_color),
+                True,
+            )
+
+        self._redraw_titles()
+        self.invalidate()
 
     def add_frame(
         self,
         frame: Self,
         pos: tuple[int, int] = (0, 0),
         change_border_color: bool = False,
+        retained: bool = False,
+        z: int = 0,
     ) -> None:
+        """Draw `frame` on this frame at `pos`, merging the borders where they meet.
+
+        If `retained`, `frame` is only drawn by `render`, above the frames with a
+        lower `z`, so it can still be changed, moved or removed afterwards.
+        """
         frame.parents.append(self)
         self.children.append(frame)
 
-        junctions: list[tuple[Junction, tuple[int, int]]] = []
-
-        def combine_junctions(coords, remove_direction=None):
-            for coord in coords:
-                coord_pos = VectorYX(coord) + VectorYX(pos)
-
-                self_junction = self[coord_pos]
-                frame_junction = frame[coord]
-
-                if not isinstance(self_junction, Junction) or not isinstance(
-                    frame_junction, Junction
-                ):
-                    continue
-
-                junction = self_junction + frame_junction
-                if remove_direction and remove_direction in junction._directions:
-                    junction._directions.pop(remove_direction)
-                junction._update_value()
-                junctions.append((junction, coord_pos))
+        if retained:
+            self.placements.append(Placement(frame, pos, z, change_border_color))
+            self.invalidate()
+            return
 
-        combine_junctions(frame.top_coords, Direction.DOWN)
-        combine_junctions(frame.bottom_coords, Direction.UP)
-        combine_junctions(frame.left_coords, Direction.RIGHT)
-        combine_junctions(frame.right_coords, Direction.LEFT)
-        combine_junctions(frame.right_coords, Direction.LEFT)
-        combine_junctions(frame.corner_coords)
+        if change_border_color and self._pending_border_color:
+            # `frame` has to keep its colors over the border
+            self._pending_border_color = False
+            self._color_border_of(self)
 
-        # self.overlay_from_top_left(frame, pos)
-        self.overlay_from_top_right(frame, pos)
-
-        for junction, coord in junctions:
-            self[coord] = junction
+        merge_frame(self, frame.render(), pos)
 
         if not change_border_color and self.border_color is not None:
             self.color_border(self.border_color)
 
-        self._add_titles()
+        self._redraw_titles()
+
+    def move_frame(
+        self,
+        frame: Self,
+        pos: Optional[tuple[int, int]] = None,
+        z: Optional[int] = None,
+    ) -> None:
+        """Move a retained frame to `pos` and/or change its `z`."""
+        placement = self._placement(frame)
+        if pos is not None:
+            placement.pos = pos
+        if z is not None:
+            placement.z = z
+
+        self._damage_placements([placement])
+
+    def remove_frame(self, frame: Self) -> None:
+        """Stop drawing a retained frame."""
+        placement = self._placement(frame)
+        self.placements.remove(placement)
+        self.children.remove(frame)
+        frame.parents.remove(self)
+
+        self._damage_placements([placement])
+
+    def _placement(self, frame: Self) -> Placement:
+        for placement in self.placements:
+            if placement.frame is frame:
+                return placement
+
+        raise ValueError("frame isn't a retained frame of this frame")
+
+    def invalidate(self) -> None:
+        """Mark the whole rendering of this frame as outdated.
+
+        Changes through `Grid` and `Frame` methods do this already.
+        """
+        if self._rendered is None:
+            return  # the frames it's drawn on know already
+
+        was_current = not self._damage
+        self._rendered = None
+        self._damage = []
+
+        if was_current:
+            for parent in self.parents:
+                parent._damage_placements(parent._placements_of(self))
+
+    def _changed(self) -> None:
+        self.invalidate()
+
+    def _placements_of(self, frame: "Frame") -> list[Placement]:
+        return [placement for placement in self.placements if placement.frame is frame]
+
+    def _damage_placements(self, placements: list[Placement]) -> None:
+        """Mark where `placements` were and are drawn as outdated."""
+        if not placements or self._rendered is None:
+            return
+
+        was_current = not self._damage
+        for placement in placements:
+            if placement.drawn is not None:
+                self._damage.append(placement.drawn)
+            self._damage.append(placement.rect)
+
+        if was_current:
+            for parent in self.parents:
+                parent._damage_placements(parent._placements_of(self))
+
+    def render(self) -> Grid:
+        """This frame with its retained frames drawn on it.
+
+        The rendering is cached, and when retained frames change only the parts
+        they cover are drawn again. Don't change the returned grid.
+        """
+        if self._rendered is not None and not self._damage:
+            return self._rendered
+
+        if not self.placements:
+            self._rendered = self
+            self._damage = []
+            return self
+
+        if self._rendered is None or self._rendered is self:
+            self._rendered = self.copy()
+            self._compose(self._rendered)
+        else:
+            bounds = (0, 0, self.height - 1, self.width - 1)
+            for rect in self._damage:
+                clip = rect_intersection(rect, bounds)
+                if clip is not None:
+                    self._compose(self._rendered, clip)
+
+        self._damage = []
+        self._add_titles(self._rendered)
+        return self._rendered
+
+    def _compose(self, rendered: Grid, clip: Optional[Ring] = None) -> None:
+        """Draw the retained frames on `rendered`, or only the part in `clip`."""
+        if clip is not None:
+            region = slice(clip[:2], clip[2:])
+            rendered[region]._copy_region(self[region], (0, 0))
+        else:
+            # Retained frames sticking out of this one are cut off, like when
+            # only a part is drawn again
+            clip = (0, 0, self.height - 1, self.width - 1)
+
+        for placement in sorted(self.placements, key=lambda placement: placement.z):
+            placement.drawn = placement.rect
+
+            drawn = rect_intersection(placement.drawn, clip)
+            if drawn is None:
+                continue
+
+            merge_frame(rendered, placement.frame.render(), placement.pos, clip)
+
+            if not placement.change_border_color and self.border_color is not None:
+                self._color_border_of(rendered, drawn)
 
 
 def get_centered_box(center_of: tuple[int, int], size: tuple[int, int]) -> slice:
@@ -1,27 +1,150 @@
-from typing import Generator, Self, overload, Optional
-
-from pyframe.colors import Color, Colors
-from pyframe.types_ import Alignment
+import errno
+import io
+import os
+import sys
+from array import array
+from functools import partial
+from itertools import groupby
+from typing import (
+    BinaryIO,
+    Callable,
+    Generator,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Self,
+    Sequence,
+    TextIO,
+    overload,
+)
+from weakref import WeakValueDictionary
+
+from pyframe.colors import DEFAULT_BACKGROUND, RESET, Color, ColorDepth, Colors
+from pyframe.types_ import Alignment, Thickness
 from pyframe.vector import VectorYX, VectorLike
 
+# Packed characters are decoded a whole row at a time
+_UTF32 = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+# Colors are stored in grids as indexes of `_palette`. Colors with the same rgb
+# share an index (cells read back from a grid get the first of them), so the
+# palette can't grow past the amount of rgb colors however many `Color`s are made.
+_palette: list[Color] = []
+_palette_indexes: dict[tuple[int, ...], int] = {}
+
+
+def _color_index(color: Optional[Color]) -> int:
+    """Get the palette index of `color`, adding it to the palette if needed."""
+    color = color or Colors.DEFAULT
+
+    index = _palette_indexes.get(color.rgb)
+    if index is None:
+        index = _palette_indexes[color.rgb] = len(_palette)
+        _palette.append(color)
+
+    return index
+
+
+_color_index(Colors.DEFAULT)  # index 0
+
+
+def _background_index(color: Optional[Color]) -> int:
+    """Backgrounds are stored as palette index + 1 (0 meaning no background)."""
+    return 0 if color is None else _color_index(color) + 1
+
+
+def _encode(string: str) -> array:
+    """Get the code points of `string`."""
+    return array("I", string.encode(_UTF32))
+
+
+def _slice_bounds(start: int, stop: int, size: int) -> tuple[int, int]:
+    """The start and (exclusive) stop in `range(size)` of an inclusive slice,
+    counting negative coordinates from the end.
+    """
+    if start < 0:
+        start += size
+    if stop < 0:
+        stop += size
+    return min(max(start, 0), size), min(max(stop + 1, 0), size)
+
+
+def _recolor(cell: "Cell", color: Optional[Color], recolored: dict) -> "Cell":
+    """`cell.with_color(color)`, looked up once per distinct cell in `recolored`
+    (by `id`, since equal cells are the same interned instance).
+    """
+    new = recolored.get(id(cell))
+    if new is None:
+        new = recolored[id(cell)] = cell.with_color(color)
+    return new
+
+
+def _write_fd(fd: int, data: bytes | bytearray) -> None:
+    """Write all of `data` to a file descriptor."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _write_raw(stream: io.RawIOBase, data: bytes | bytearray) -> None:
+    """Write all of `data` to a raw stream, which may only write some of it."""
+    view = memoryview(data)
+    while view:
+        written = stream.write(view)
+        if written is None:
+            raise BlockingIOError(errno.EAGAIN, "stream isn't ready for writing")
+        view = view[written:]
+
 
 class Cell:
-    """A Cell in a matrix."""
+    """A Cell in a matrix.
 
-    def __init__(
-        self,
+    Cells are immutable and interned: creating a cell that already exists returns
+    the same instance. Use `with_color` / `with_background` to get a changed cell.
+    """
+
+    __slots__ = ("value", "color", "background", "__weakref__")
+
+    # Weak, so cells (and the colors they hold) that aren't used anymore go away
+    _interned: "WeakValueDictionary[tuple, Cell]" = WeakValueDictionary()
+
+    value: str
+    color: Color
+    background: Optional[Color]
+
+    def __new__(
+        cls,
         value: str,
         color: Optional[Color] = Colors.DEFAULT,
-    ) -> None:
-        if len(value) > 1:
-            raise ValueError("value more than 1 character. use `BorderPattern`")
+        background: Optional[Color] = None,
+    ) -> Self:
+        color = color or Colors.DEFAULT
+
+        key = (cls, value, color, background)
+        cell = Cell._interned.get(key)
+        if cell is None:
+            if len(value) > 1:
+                raise ValueError("value more than 1 character. use `BorderPattern`")
+
+            cell = object.__new__(cls)
+            object.__setattr__(cell, "value", value)
+            object.__setattr__(cell, "color", color)
+            object.__setattr__(cell, "background", background)
+            Cell._interned[key] = cell
+
+        return cell
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
-        self.value = value
-        self.color = color or Colors.DEFAULT
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
-    def update(self, cell: Self):
-        self.value = cell.value
-        self.color = cell.color
+    def with_color(self, color: Optional[Color]) -> Self:
+        return Cell(self.value, color, self.background)
+
+    def with_background(self, background: Optional[Color]) -> Self:
+        return Cell(self.value, self.color, background)
 
     def __repr__(self) -> str:
         return str(self.value)
@@ -47,61 +170,59 @@ class Cell:
     #     )
 
     def __mul__(self, times: int) -> tuple[Self, ...]:
-        return tuple(type(self)(self.value, self.color) for _ in range(times))
+        return (self,) * times
 
     # @classmethod
     # def padding(cls, width: int, value=" ") -> tuple[Self, ...]:
     #     return tuple(cls(value) for _ in range(width))
 
-    # def __eq__(self, to):
-    #     return self.value == to._value and self.color == to.color
-
-    # def __hash__(self) -> int:
-    #     return hash((self.value, self.color))
+    def __eq__(self, to):
+        if not isinstance(to, Cell):
+            return NotImplemented
+        return self._key() == to._key()
 
-    # def __copy__(self):
-    #     return Cell(self.value, self.color)
+    def __hash__(self) -> int:
+        return hash(self._key())
 
+    def _key(self) -> tuple:
+        return (type(self), self.value, self.color, self.background)
 
-class Grid:
-    # def camera(self) -> Frame:
-    #     """Get a selection of the Map around the player."""
-    #     pos_y, pos_x = self.pos
-    #     range_y, range_x = self.camera_range
+    def __copy__(self):
+        return self
 
-    #     size_i = self.size.i
+    def __deepcopy__(self, memo):
+        return self
 
-    #     end_y, end_x = (pos_y + range_y, pos_x + range_x)
-    #     start_y, start_x = (max(pos_y - range_y, 0), max(pos_x - range_x, 0))
+    def __reduce__(self):
+        return (type(self), (self.value, self.color, self.background))
 
-    #     if start_x == 0:
-    #         end_x += range_x - pos_x
 
-    #     if start_y == 0:
-    #         end_y += range_y - pos_y
+# A slice like `grid[(y, x):(y, x)]` or `(start, stop)`
+RectLike = slice | tuple[VectorLike, VectorLike]
 
-    #     if end_x > size_i.x:
-    #         start_x -= end_x - size_i.x
-    #         end_x = size_i.x
 
-    #     if end_y > size_i.y:
-    #         start_y -= end_y - size_i.y
-    #         end_y = size_i.y
+class PackedCells(NamedTuple):
+    """A run of cells packed like in a grid, to write the same cells many times."""
 
-    #     start = Coord(start_y, start_x)
-    #     end = Size(end_y, end_x)
+    cells: tuple[Cell, ...]
+    chars: array
+    colors: array
+    backgrounds: array
+    any_plain: bool  # whether some are plain `Cell`s, which aren't kept as objects
 
-    #     camera = Grid(
-    #         tuple(
-    #             tuple(self[coord] for coord in row)
-    #             for row in end.array_rect_range(start)
-    #         )
-    #     )
+    @classmethod
+    def pack(cls, cells: Iterable[Cell]) -> "PackedCells":
+        cells = tuple(cells)
+        return cls(
+            cells,
+            array("I", [ord(cell.value) if cell.value else 0 for cell in cells]),
+            array("I", [_color_index(cell.color) for cell in cells]),
+            array("I", [_background_index(cell.background) for cell in cells]),
+            any(type(cell) is Cell for cell in cells),
+        )
 
-    #     camera.extend_column(None, -1)
-    #     camera.extend_column()
 
-    #     return Frame(camera.cells)
+class Grid:
     def __init__(
         self,
         cells: str | list[list[Cell]],
@@ -109,22 +230,18 @@ class Grid:
     ):
         if isinstance(cells, str):
             rows = cells.split("\n")
-            self._cells = [[Cell(cell) for cell in row] for row in rows]
-        else:
-            self._cells = cells
-
-        self.height = len(self._cells)
+            self._pack_strings(rows, alignment)
+            return
 
         def create_padding(width: int, value=" ") -> list[Cell]:
             return [Cell(value) for _ in range(width)]
 
         def level_out(rows: list[list[Cell]], alignment: Alignment = Alignment.LEFT):
             """Level out the rows of the matrix making them all the same width."""
-            max_length = max(sum([len(cell) for cell in row]) for row in rows)
-
-            for i, row in enumerate(rows):
-                row_length = sum([len(cell) for cell in row])
+            row_lengths = [sum([len(cell) for cell in row]) for row in rows]
+            max_length = max(row_lengths)
 
+            for i, (row, row_length) in enumerate(zip(rows, row_lengths)):
                 if row_length >= max_length:
                     continue
 
@@ -140,12 +257,234 @@ class Grid:
                         + row
                         + create_padding(right_padding)
                     )
-            return max_length
 
-        if self._cells:
-            self.width = level_out(self._cells, alignment)
+        if cells:
+            level_out(cells, alignment)
+
+        # Empty cells don't count when leveling out, so rows can still differ
+        width = max(map(len, cells), default=0)
+        empty = Cell("")
+        self._pack(
+            [row + [empty] * (width - len(row)) for row in cells],
+            width,
+        )
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Sequence[Cell]],
+        width: Optional[int] = None,
+        trusted: bool = False,
+    ) -> Self:
+        """Make a grid of rows that are all `width` cells long, without leveling
+        them out like `Grid()`.
+
+        `width` defaults to the length of the first row. Unless the rows are
+        `trusted` to be rectangular, rows of other lengths raise a `ValueError`.
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        if width is None:
+            width = len(rows[0]) if rows else 0
+
+        if not trusted and any(len(row) != width for row in rows):
+            raise ValueError(f"rows must all be {width} cells long")
+
+        grid = cls.__new__(cls)
+        grid._pack(rows, width)
+        return grid
+
+    def _pack(self, rows: list[Sequence[Cell]], width: int) -> None:
+        """Store `rows` of `width` cells in the packed arrays."""
+        cells = [cell for row in rows for cell in row]
+
+        self.height = len(rows)
+        self.width = width
+        self._offset = 0
+        self._stride = width
+
+        # Look up each distinct color once instead of once per cell
+        color_indexes = {
+            color: _color_index(color) for color in {cell.color for cell in cells}
+        }
+        background_indexes = {
+            color: _background_index(color)
+            for color in {cell.background for cell in cells}
+        }
+
+        self._chars = _encode("".join([cell.value or "\0" for cell in cells]))
+        self._colors = array("I", [color_indexes[cell.color] for cell in cells])
+        self._backgrounds = array(
+            "I", [background_indexes[cell.background] for cell in cells]
+        )
+
+        # Subclasses such as `Junction` carry state that can't be packed.
+        self._objects: dict[int, Cell] = {}
+        if set(map(type, cells)) - {Cell}:
+            self._objects = {
+                i: cell for i, cell in enumerate(cells) if type(cell) is not Cell
+            }
+
+    def _pack_strings(self, rows: list[str], alignment: Alignment) -> None:
+        """Store `rows` of characters in the packed arrays without creating cells."""
+        width = max(map(len, rows), default=0)
+        self._allocate(len(rows), width)
+
+        for y, row in enumerate(rows):
+            padding = width - len(row)
+            if alignment == Alignment.RIGHT:
+                row = " " * padding + row
+            elif alignment == Alignment.CENTER:
+                row = " " * (padding // 2) + row + " " * (padding - padding // 2)
+            else:
+                row = row + " " * padding
+
+            start = self._row_start(y)
+            self._chars[start : start + width] = _encode(row)
+
+    def _allocate(self, height: int, width: int, fill: str = " ") -> None:
+        """Replace the storage with a `height` by `width` grid of `fill` characters."""
+        self.height = height
+        self.width = width
+        self._offset = 0
+        self._stride = width
+
+        self._chars = array("I", [ord(fill) if fill else 0]) * (height * width)
+        self._colors = array("I", bytes(4 * height * width))  # 0 -> Colors.DEFAULT
+        self._backgrounds = array("I", bytes(4 * height * width))
+        self._objects: dict[int, Cell] = {}
+
+    def _adopt(self, grid: "Grid") -> None:
+        """Take over the storage of another grid."""
+        self.height = grid.height
+        self.width = grid.width
+        self._offset = grid._offset
+        self._stride = grid._stride
+
+        self._chars = grid._chars
+        self._colors = grid._colors
+        self._backgrounds = grid._backgrounds
+        self._objects = grid._objects
+
+    def _index(self, y: int, x: int) -> int:
+        """The position of `(y, x)` in the packed arrays."""
+        if y < 0:
+            y += self.height
+        if x < 0:
+            x += self.width
+
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise IndexError("grid index out of range")
+
+        return self._offset + y * self._stride + x
+
+    def _row_start(self, y: int) -> int:
+        """The position of the start of row `y` in the packed arrays."""
+        return self._offset + y * self._stride
+
+    def _position(self, index: int) -> Optional[tuple[int, int]]:
+        """The `(y, x)` of a position in the packed arrays, if it's in the grid."""
+        y, x = divmod(index - self._offset, self._stride or 1)
+        if 0 <= y < self.height and 0 <= x < self.width:
+            return y, x
+        return None
+
+    def _objects_in(
+        self, pos: tuple[int, int], height: int, width: int
+    ) -> list[tuple[int, int, int]]:
+        """The `(index, y, x)` of the cell objects in a region of the grid."""
+        objects = []
+        if height * width < len(self._objects):
+            # Small region: look its cells up instead of going over every object
+            for y in range(pos[0], pos[0] + height):
+                start = self._row_start(y)
+                for x in range(pos[1], pos[1] + width):
+                    if start + x in self._objects:
+                        objects.append((start + x, y, x))
+            return objects
+
+        for i in self._objects:
+            position = self._position(i)
+            if position is None:
+                continue
+
+            y, x = position
+            if pos[0] <= y < pos[0] + height and pos[1] <= x < pos[1] + width:
+                objects.append((i, y, x))
+
+        return objects
+
+    def _cell(self, index: int) -> Cell:
+        """Create the `Cell` stored at `index`."""
+        obj = self._objects.get(index)
+        if obj is not None:
+            return obj
+
+        code = self._chars[index]
+        background = self._backgrounds[index]
+        return Cell(
+            chr(code) if code else "",
+            _palette[self._colors[index]],
+            _palette[background - 1] if background else None,
+        )
+
+    def _store(self, index: int, cell: Cell) -> None:
+        """Pack `cell` at `index`."""
+        # Look everything up first, so a bad cell doesn't get half written
+        char = ord(cell.value) if cell.value else 0
+        color = _color_index(cell.color)
+        background = _background_index(cell.background)
+
+        self._chars[index] = char
+        self._colors[index] = color
+        self._backgrounds[index] = background
+
+        # Subclasses such as `Junction` carry state that can't be packed.
+        if type(cell) is Cell:
+            self._objects.pop(index, None)
         else:
-            self.width = 0
+            self._objects[index] = cell
+
+    def _write_cells(
+        self,
+        y: int,
+        x: int,
+        cells: Iterable[Cell] | PackedCells,
+        vertical: bool = False,
+    ) -> None:
+        """Pack `cells` into row `y` starting at column `x` (or down column `x`)."""
+        if not isinstance(cells, PackedCells):
+            cells = PackedCells.pack(cells)
+
+        start = self._index(y, x)
+        if len(cells.cells) > 1:  # check that the last cell fits too
+            if vertical:
+                self._index(y + len(cells.cells) - 1, x)
+            else:
+                self._index(y, x + len(cells.cells) - 1)
+
+        step = self._stride if vertical else 1
+        positions = range(start, start + step * len(cells.cells), step)
+        self._chars[positions.start : positions.stop : step] = cells.chars
+        self._colors[positions.start : positions.stop : step] = cells.colors
+        self._backgrounds[positions.start : positions.stop : step] = cells.backgrounds
+
+        # Subclasses such as `Junction` carry state that can't be packed.
+        if not cells.any_plain:
+            self._objects.update(zip(positions, cells.cells))
+            return
+
+        for i, cell in enumerate(cells.cells):
+            if type(cell) is Cell:
+                self._objects.pop(positions[i], None)
+            else:
+                self._objects[positions[i]] = cell
+
+    def _changed(self) -> None:
+        """Called after the public methods change cells, for subclasses to hook into."""
+
+    def _row_cells(self, y: int) -> list[Cell]:
+        start = self._row_start(y)
+        return [self._cell(i) for i in range(start, start + self.width)]
 
     @classmethod
     def empty(
@@ -153,9 +492,9 @@ class Grid:
         height: int,
         width: int,
     ) -> "Grid":
-        return Grid(
-            [[Cell(" ") for _ in range(width)] for _ in range(height)],
-        )
+        grid = cls.__new__(cls)
+        grid._allocate(height, width)
+        return grid
 
     @property
     def size(self) -> tuple[int, int]:
@@ -164,22 +503,211 @@ class Grid:
 
     def color(self, color: Color, coords: list[tuple[int, int]]) -> None:
         """Color cells in the matrix."""
+        index = _color_index(color)
+        recolored: dict[int, Cell] = {}
         for coord in coords:
-            self[coord].color = color
+            i = self._index(*coord)
+            self._colors[i] = index
+
+            if i in self._objects:
+                self._objects[i] = _recolor(self._objects[i], color, recolored)
+
+        self._changed()
 
     def color_all(self, color: Color) -> None:
         """Color the whole matrix a certain color."""
-        for cell in self:
-            cell.color = color
+        self._fill_rows(self._colors, _color_index(color))
+
+        recolored: dict[int, Cell] = {}
+        for i, _, _ in self._objects_in((0, 0), self.height, self.width):
+            self._objects[i] = _recolor(self._objects[i], color, recolored)
+
+        self._changed()
+
+    def _fill_rows(self, storage: array, value: int) -> None:
+        """Set every cell of one of the packed arrays to `value`, a row at a time."""
+        row = array(storage.typecode, [value]) * self.width
+        for y in range(self.height):
+            start = self._row_start(y)
+            storage[start : start + self.width] = row
+
+    def _view(self, rect: RectLike) -> "GridView":
+        if not isinstance(rect, slice):
+            rect = slice(*rect)
+        return self[rect]
+
+    def fill_rect(
+        self,
+        rect: RectLike,
+        char: str = " ",
+        color: Optional[Color] = Colors.DEFAULT,
+        background: Optional[Color] = None,
+    ) -> None:
+        """Fill a rectangle (inclusive, like `grid[(y, x):(y, x)]`) with `char`."""
+        view = self._view(rect)
+        view._fill_rows(view._chars, ord(char) if char else 0)
+        view._fill_rows(view._colors, _color_index(color))
+        view._fill_rows(view._backgrounds, _background_index(background))
+
+        for i, _, _ in view._objects_in((0, 0), view.height, view.width):
+            del view._objects[i]
+
+        self._changed()
+
+    def color_rect(self, rect: RectLike, color: Color) -> None:
+        """Color a rectangle (inclusive, like `grid[(y, x):(y, x)]`)."""
+        self._view(rect).color_all(color)
+        self._changed()
+
+    def write_text(
+        self,
+        pos: VectorLike,
+        text: str,
+        color: Optional[Color] = Colors.DEFAULT,
+        clip: bool = True,
+        background: Optional[Color] = None,
+    ) -> None:
+        """Write `text` starting at `pos`, with each line of `text` on the next row.
+
+        If `clip`, text outside of the grid is cut off, otherwise it raises an
+        `IndexError`.
+        """
+        y, x = VectorYX(pos)
+        color_index = _color_index(color)
+        background_index = _background_index(background)
+
+        for row, line in enumerate(text.split("\n"), y):
+            start_x = x
+            if clip:
+                if not 0 <= row < self.height:
+                    continue
+                if start_x < 0:
+                    line = line[-start_x:]
+                    start_x = 0
+                line = line[: max(self.width - start_x, 0)]
+            elif not (
+                0 <= row < self.height
+                and 0 <= start_x
+                and start_x + len(line) <= self.width
+            ):
+                raise IndexError("text doesn't fit in the grid")
+
+            if not line:
+                continue
+
+            start = self._row_start(row) + start_x
+            stop = start + len(line)
+            self._chars[start:stop] = _encode(line)
+            self._colors[start:stop] = array("I", [color_index]) * len(line)
+            self._backgrounds[start:stop] = array("I", [background_index]) * len(line)
+
+            for i, _, _ in self._objects_in((row, start_x), 1, len(line)):
+                del self._objects[i]
+
+        self._changed()
+
+    def polyline(
+        self,
+        points: Sequence[VectorLike],
+        thickness: Thickness = Thickness.THIN,
+        style: str = "default",
+        color: Optional[Color] = Colors.DEFAULT,
+        closed: bool = False,
+    ) -> None:
+        """Draw a box-drawing line through `points` (each part horizontal or
+        vertical), joining the junctions already in the grid where it meets them.
+
+        The ends of the line that meet a junction only lead into the line, like
+        connectors ending on a border (`├`, `┬`, ...). If `closed`, the last point
+        joins back to the first. Raises an `IndexError` (without drawing any of
+        it) if the line doesn't fit in the grid.
+        """
+        # Junctions are built on grids, so they can't be imported with them
+        from pyframe.border.lines import draw_path
+
+        draw_path(self, points, thickness, style, color, closed)
+
+    def hline(
+        self,
+        pos: VectorLike,
+        length: int,
+        thickness: Thickness = Thickness.THIN,
+        style: str = "default",
+        color: Optional[Color] = Colors.DEFAULT,
+    ) -> None:
+        """Draw a horizontal line `length` cells long (at least 2) from `pos`."""
+        if length < 2:
+            raise ValueError("lines are at least 2 cells long")
+        y, x = VectorYX(pos)
+        self.polyline([(y, x), (y, x + length - 1)], thickness, style, color)
+
+    def vline(
+        self,
+        pos: VectorLike,
+        length: int,
+        thickness: Thickness = Thickness.THIN,
+        style: str = "default",
+        color: Optional[Color] = Colors.DEFAULT,
+    ) -> None:
+        """Draw a vertical line `length` cells long (at least 2) down from `pos`."""
+        if length < 2:
+            raise ValueError("lines are at least 2 cells long")
+        y, x = VectorYX(pos)
+        self.polyline([(y, x), (y + length - 1, x)], thickness, style, color)
+
+    def rect(
+        self,
+        rect: RectLike,
+        thickness: Thickness = Thickness.THIN,
+        style: str = "default",
+        color: Optional[Color] = Colors.DEFAULT,
+    ) -> None:
+        """Draw the outline of a rectangle (inclusive, like `grid[(y, x):(y, x)]`),
+        like a frame's border but without making a frame.
+        """
+        if isinstance(rect, slice):
+            rect = (rect.start, rect.stop)
+        (top, left), (bottom, right) = rect
+
+        self.polyline(
+            [(top, left), (top, right), (bottom, right), (bottom, left)],
+            thickness,
+            style,
+            color,
+            closed=True,
+        )
+
+    def color_where(self, predicate: Callable[[str], bool], color: Color) -> None:
+        """Color the cells whose character `predicate` returns `True` for."""
+        index = _color_index(color)
+        for y in range(self.height):
+            start = self._row_start(y)
+            row = self._chars[start : start + self.width].tobytes().decode(_UTF32)
+
+            for i, char in enumerate(row, start):
+                if predicate(char if char != "\0" else ""):
+                    self._colors[i] = index
+
+                    if i in self._objects:
+                        self._objects[i] = self._objects[i].with_color(color)
+
+        self._changed()
 
     def __iter__(self) -> Generator[Cell, None, None]:
         """Iterate through every cell."""
-        for row in self._cells:
-            for cell in row:
-                yield cell
+        for y in range(self.height):
+            start = self._row_start(y)
+            for i in range(start, start + self.width):
+                yield self._cell(i)
+
+    def copy(self) -> "Grid":
+        """Get a grid with its own copy of the cells."""
+        grid = Grid.empty(self.height, self.width)
+        grid._copy_region(self, (0, 0))
+        return grid
 
     @overload
-    def __getitem__(self, row: int, /) -> Self: ...
+    def __getitem__(self, row: int, /) -> list[Cell]: ...
 
     @overload
     def __getitem__(self, slice_: slice, /) -> Self: ...
@@ -191,25 +719,92 @@ class Grid:
     def __getitem__(self, vector: VectorLike, /) -> Cell: ...
 
     def __getitem__(self, item, /):
+        """Cells are created on demand, so changes to them don't affect the grid.
+
+        Assign them back with `grid[y, x] = cell` or use `color`.
+
+        Slices are `GridView`s that share the cells of the grid.
+        """
 
         if isinstance(item, tuple):
-            return self._cells[item[0]][item[1]]
+            return self._cell(self._index(*item))
 
         elif isinstance(item, slice):
             start_y, start_x = item.start or (0, 0)
+            stop_y, stop_x = item.stop or (-1, -1)
 
-            if item.stop is None:
-                stop_y, stop_x = (self.height - start_y, self.width - start_x)
-            else:
-                stop_y, stop_x = item.stop
+            # Negative coordinates count from the end, like `_index`, and the
+            # view is cut down to the part inside the grid
+            start_y, stop_y = _slice_bounds(start_y, stop_y, self.height)
+            start_x, stop_x = _slice_bounds(start_x, stop_x, self.width)
 
-            stop_y += 1
-            stop_x += 1
-
-            return Grid([row[start_x:stop_x] for row in self._cells[start_y:stop_y]])
+            return GridView(
+                self,
+                (start_y, start_x),
+                (max(stop_y - start_y, 0), max(stop_x - start_x, 0)),
+            )
 
         elif isinstance(item, int):
-            return self._cells[item]
+            if item < 0:
+                item += self.height
+            if not 0 <= item < self.height:
+                raise IndexError("grid index out of range")
+            return self._row_cells(item)
+
+    def viewport(
+        self,
+        pos: VectorLike,
+        size: VectorLike,
+        center: bool = False,
+        clamp: bool = True,
+    ) -> "Viewport":
+        """A `size` view of the grid with its top left at `pos` (or its middle, if
+        `center`), to show part of a big grid like a camera.
+
+        If `clamp`, the viewport is kept inside the grid (and shrunk if the grid is
+        smaller), otherwise it raises an `IndexError` if it doesn't fit.
+        """
+        return Viewport(self, pos, size, center, clamp)
+
+    def _copy_region(
+        self, source: "Grid", source_pos: tuple[int, int], pos: tuple[int, int] = (0, 0)
+    ) -> None:
+        """Copy as much of `source` starting at `source_pos` as fits at `pos`."""
+        source_y, source_x = source_pos
+        y, x = pos
+
+        height = min(source.height - source_y, self.height - y)
+        width = min(source.width - source_x, self.width - x)
+        if height <= 0 or width <= 0:
+            return
+
+        if source._chars is self._chars:
+            # Overlapping views of the same storage
+            source = source[source_pos : VectorYX(source_pos) + (height - 1, width - 1)]
+            source = source.copy()
+            source_y, source_x = source_pos = (0, 0)
+
+        for row in range(height):
+            start = self._row_start(y + row) + x
+            source_start = source._row_start(source_y + row) + source_x
+
+            self._chars[start : start + width] = source._chars[
+                source_start : source_start + width
+            ]
+            self._colors[start : start + width] = source._colors[
+                source_start : source_start + width
+            ]
+            self._backgrounds[start : start + width] = source._backgrounds[
+                source_start : source_start + width
+            ]
+
+        for i, _, _ in self._objects_in(pos, height, width):
+            del self._objects[i]
+
+        for i, row, column in source._objects_in(source_pos, height, width):
+            self._objects[
+                self._row_start(row - source_y + y) + column - source_x + x
+            ] = source._objects[i]
 
     @overload
     def __setitem__(self, slice_: slice, matrix: "Grid", /) -> None: ...
@@ -222,26 +817,29 @@ class Grid:
 
     def __setitem__(self, item, new_cells, /) -> None:
         if isinstance(item, tuple):
-            self._cells[item[0]][item[1]] = new_cells  # update?
+            self._store(self._index(*item), new_cells)
 
         elif isinstance(item, int):
-            self._cells[item] = new_cells
+            if len(new_cells) != self.width:
+                raise ValueError("row must be the same width as the grid")
+
+            self._write_cells(item, 0, new_cells)
 
         elif isinstance(item, slice):
             start_y, start_x = item.start or (
                 (item.stop[0] - new_cells.height + 1),
                 (item.stop[1] - new_cells.width + 1),
             )
-            stop_y, stop_x = item.stop or (
-                (item.start[0] + new_cells.height - 1),
-                (item.start[1] + new_cells.width - 1),
-            )
 
             if start_x < 0 or start_y < 0:
                 raise IndexError("cannot be negative")
 
-            for i in range(start_y, stop_y + 1):
-                self._cells[i][start_x : stop_x + 1] = new_cells[i - start_y]
+            if start_y + new_cells.height > self.height:
+                raise IndexError("grid index out of range")
+
+            self._copy_region(new_cells, (0, 0), (start_y, start_x))
+
+        self._changed()
 
     def overlay_from_top_left(self, m: "Grid", pos: VectorLike) -> None:
         self[pos:] = m
@@ -256,36 +854,149 @@ class Grid:
         self[VectorYX(pos) - VectorYX(0, m.width) :] = m
 
     @property
-    def rows(self):
-        """The same as `self.cells` (for readability in for loops: `for row in rows`"""
-        return self._cells
+    def rows(self) -> list[list[Cell]]:
+        """The cells of each row (for readability in for loops: `for row in rows`)"""
+        return [self._row_cells(y) for y in range(self.height)]
+
+    def _row_codes(
+        self, y: int, start: int = 0, stop: Optional[int] = None
+    ) -> tuple[array, array, array]:
+        """Copies of the packed characters, colors and backgrounds of row `y` (from
+        column `start` to `stop`).
+        """
+        row_start = self._row_start(y)
+        stop = row_start + (self.width if stop is None else stop)
+        start = row_start + start
+        return (
+            self._chars[start:stop],
+            self._colors[start:stop],
+            self._backgrounds[start:stop],
+        )
 
-    def __str__(self) -> str:
-        """The values of each cell joined together."""
-        x = []
-        for row in self.rows:
-            for cell in row + [Cell("\n")]:
-                x.append(str(cell.value))
+    def _content_spans(self, y: int) -> list[tuple[int, int]]:
+        """The `(start, stop)` columns of row `y` that may hold something other than
+        default colored spaces (all of it, unless a subclass keeps track).
+        """
+        return [(0, self.width)] if self.width else []
+
+    def _row_str(self, y: int) -> str:
+        start = self._row_start(y)
+        string = self._chars[start : start + self.width].tobytes().decode(_UTF32)
+        if "\0" in string:
+            return string.replace("\0", "")  # empty cells
+        return string
 
-        return "".join(x)[:-1]
+    def _colored_row_str(self, y: int, depth: ColorDepth, first: bool) -> str:
+        """Row `y` with the escape codes of each run of colors.
+
+        Rows end with the default color, so only the `first` row has no color to
+        carry over.
+        """
+        chars, colors, backgrounds = self._row_codes(y)
+        row = chars.tobytes().decode(_UTF32)
 
-    def colored_str(self) -> str:
-        """The colors and values of each cell joined together."""
         x = []
-        pre_cell = None
-        for row in self.rows:
-            for cell in row + [Cell("\n")]:
-                color = ""
-                if pre_cell is None:
-                    color = f'\033[38;2;{";".join([str(x) for x in cell.color.rgb])}m'
-                elif pre_cell.color != cell.color:
-                    color = f'\033[38;2;{";".join([str(x) for x in cell.color.rgb])}m'
+        pre_color = None if first else 0
+        pre_background = 0
+
+        start = 0
+        for (color, background), run in groupby(zip(colors, backgrounds)):
+            if color != pre_color:
+                x.append(_palette[color].depth_sgr(depth))
+                pre_color = color
+            if background != pre_background:
+                x.append(
+                    _palette[background - 1].depth_sgr(depth, background=True)
+                    if background
+                    else DEFAULT_BACKGROUND
+                )
+                pre_background = background
+
+            stop = start + len(list(run))
+            x.append(row[start:stop])
+            start = stop
+
+        # Rows end with a default colored new line
+        if pre_color != 0:
+            x.append(Colors.DEFAULT.depth_sgr(depth))
+        if pre_background:
+            x.append(DEFAULT_BACKGROUND)
+
+        return "".join(x).replace("\0", "")
+
+    def iter_lines(
+        self, colored: bool = False, depth: ColorDepth = ColorDepth.TRUECOLOR
+    ) -> Generator[str, None, None]:
+        """Yield each row as a string (without the new line), one at a time."""
+        for y in range(self.height):
+            if colored:
+                yield self._colored_row_str(y, depth, first=y == 0)
+            else:
+                yield self._row_str(y)
 
-                pre_cell = cell
+    def write_to(
+        self,
+        stream: TextIO | BinaryIO | int,
+        colored: bool = True,
+        depth: ColorDepth = ColorDepth.TRUECOLOR,
+        chunk_size: int = 1 << 16,
+    ) -> None:
+        """Write the grid to a text stream, binary stream or file descriptor.
+
+        Rows are encoded one at a time into a buffer that is written every
+        `chunk_size` bytes, so the whole string is never built. Writes the same
+        text as `colored_str` (or `str` if not `colored`).
+        """
+        if isinstance(stream, io.TextIOBase):
+            buffer = []
+            length = 0
+            for y, line in enumerate(self.iter_lines(colored, depth)):
+                if y:
+                    buffer.append("\n")
+                buffer.append(line)
+                length += len(line) + 1
+
+                if length >= chunk_size:
+                    stream.write("".join(buffer))
+                    buffer.clear()
+                    length = 0
+
+            if colored:
+                buffer.append(RESET)
+            stream.write("".join(buffer))
+            return
+
+        if isinstance(stream, int):
+            write = partial(_write_fd, stream)
+        elif isinstance(stream, io.RawIOBase):
+            write = partial(_write_raw, stream)
+        else:
+            write = stream.write  # buffered streams write all of it (or raise)
 
-                x.append(color + str(cell.value))
+        buffer = bytearray()
+        for y, line in enumerate(self.iter_lines(colored, depth)):
+            if y:
+                buffer += b"\n"
+            buffer += line.encode()
 
-        return "".join(x)[:-1] + f"\033[0m"
+            if len(buffer) >= chunk_size:
+                write(buffer)
+                buffer.clear()
+
+        if colored:
+            buffer += RESET.encode()
+        write(buffer)
+
+    def __str__(self) -> str:
+        """The values of each cell joined together."""
+        return "\n".join(self.iter_lines())
+
+    def colored_str(self, depth: ColorDepth = ColorDepth.TRUECOLOR) -> str:
+        """The colors and values of each cell joined together.
+
+        `depth` downsamples the colors for terminals that can't show 24-bit colors.
+        """
+        return "\n".join(self.iter_lines(colored=True, depth=depth)) + RESET
 
     # Sprites
     # def remove_whitespace_sides(self):
@@ -304,3 +1015,87 @@ class Grid:
     #     ):
     #         matrix.pop()
     #     self.cells = tuple(matrix)
+
+
+class GridView(Grid):
+    """A rectangle of another grid that shares its cells.
+
+    Reading and writing go through to the grid it views, so creating one costs
+    nothing no matter how big the rectangle is. Use `copy` to get a separate grid.
+
+    A view no longer follows its grid if the grid is resized (e.g. `Frame.border`).
+    """
+
+    def __init__(self, grid: Grid, pos: VectorLike, size: tuple[int, int]) -> None:
+        self.grid = grid
+        self.pos = VectorYX(pos)
+
+        self._adopt(grid)
+        self.height, self.width = size
+        self._offset = grid._row_start(self.pos.y) + self.pos.x
+
+    def _changed(self) -> None:
+        self.grid._changed()
+
+    def _content_spans(self, y: int) -> list[tuple[int, int]]:
+        x = self.pos.x
+        return [
+            (max(start - x, 0), min(stop - x, self.width))
+            for start, stop in self.grid._content_spans(self.pos.y + y)
+            if start < x + self.width and stop > x
+        ]
+
+
+class Viewport(GridView):
+    """A view that can be moved around its grid, made by `Grid.viewport`.
+
+    Moving it only changes where it starts in the grid, so it costs the same no
+    matter how big the grid is, and renderers repaint just the cells that look
+    different after moving.
+
+    ```
+    camera = world.viewport(player, (24, 80), center=True)
+    camera.scroll(0, 1)  # pan right
+    renderer.flush(camera, sys.stdout)
+    ```
+    """
+
+    def __init__(
+        self,
+        grid: Grid,
+        pos: VectorLike,
+        size: VectorLike,
+        center: bool = False,
+        clamp: bool = True,
+    ) -> None:
+        height, width = VectorYX(size)
+        if clamp:
+            height = min(height, grid.height)
+            width = min(width, grid.width)
+
+        super().__init__(grid, (0, 0), (height, width))
+        self.clamp = clamp
+        self.move_to(pos, center)
+
+    def move_to(self, pos: VectorLike, center: bool = False) -> None:
+        """Put the top left of the viewport (or its middle, if `center`) at `pos`."""
+        y, x = VectorYX(pos)
+        if center:
+            y -= self.height // 2
+            x -= self.width // 2
+
+        if self.clamp:
+            y = min(max(y, 0), self.grid.height - self.height)
+            x = min(max(x, 0), self.grid.width - self.width)
+        elif not (
+            0 <= y <= self.grid.height - self.height
+            and 0 <= x <= self.grid.width - self.width
+        ):
+            raise IndexError("viewport doesn't fit in the grid")
+
+        self.pos = VectorYX(y, x)
+        self._offset = self.grid._row_start(y) + x
+
+    def scroll(self, dy: int, dx: int = 0) -> None:
+        """Move the viewport `dy` rows down and `dx` columns right."""
+        self.move_to(self.pos + (dy, dx))
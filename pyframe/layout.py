@@ -0,0 +1,314 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, NamedTuple, Optional
+
+from pyframe.frame import Frame
+from pyframe.types_ import Alignment
+
+
+@dataclass(frozen=True)
+class Fixed:
+    """A size of `cells`."""
+
+    cells: int
+
+
+@dataclass(frozen=True)
+class Percent:
+    """A size of `percent` of the space in the container."""
+
+    percent: float
+
+
+@dataclass(frozen=True)
+class Flex:
+    """A share of the space left over by the other boxes, by `weight`."""
+
+    weight: int = 1
+
+
+SizeLike = Fixed | Percent | Flex | int  # ints are fixed sizes
+
+# Top, left, bottom, right (or all of them)
+Padding = tuple[int, int, int, int] | int
+
+
+class Rect(NamedTuple):
+    y: int
+    x: int
+    height: int
+    width: int
+
+    @property
+    def pos(self) -> tuple[int, int]:
+        return self.y, self.x
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.height, self.width
+
+
+# The rectangles of the children of a box, relative to the box
+Arrangement = list[tuple["Box", Rect]]
+
+
+class Box:
+    """A rectangle of a layout, which lays out its `children` in a row or column.
+
+    - `size` -> the size along the row or column of its parent
+    - `cross` -> the size the other way (`None` stretches to fill the parent)
+    - `align` -> where the box goes if it doesn't fill the parent the other way
+    - `padding` and `gap` -> space around and between the children
+    - `frame` -> a frame placed in the box by `Layout.place`, or a function of the
+      height and width of the box that makes one (a frame bigger than the box
+      isn't placed, until the box is big enough for it)
+
+    Use `Row` and `Column`. The arrangement of a box is cached for each size it
+    was laid out in, until one of its attributes (or its children) change.
+    """
+
+    horizontal = True
+
+    CACHE_SIZE = 8
+
+    def __init__(
+        self,
+        *children: "Box",
+        size: SizeLike = Flex(),
+        cross: Optional[SizeLike] = None,
+        align: Alignment = Alignment.LEFT,
+        padding: Padding = 0,
+        gap: int = 0,
+        frame: Optional[Frame | Callable[[int, int], Frame]] = None,
+    ) -> None:
+        self._parent: Optional[Box] = None
+        self._cache: OrderedDict[tuple[int, int], Arrangement] = OrderedDict()
+
+        self.size = size
+        self.cross = cross
+        self.align = align
+        self.padding = padding
+        self.gap = gap
+        self.frame = frame
+
+        self.children: tuple[Box, ...] = ()
+        for child in children:
+            self.add(child)
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Forget the arrangements of this box and the boxes it's in."""
+        box = self
+        while box is not None:
+            box._cache.clear()
+            box = box._parent
+
+    def add(self, child: "Box") -> None:
+        if child._parent is not None:
+            child._parent.remove(child)
+        child._parent = self
+        self.children += (child,)
+
+    def remove(self, child: "Box") -> None:
+        self.children = tuple(box for box in self.children if box is not child)
+        child._parent = None
+
+    def arrange(self, height: int, width: int) -> Arrangement:
+        """The rectangles of the children of this box, if it's `height` by `width`."""
+        arrangement = self._cache.get((height, width))
+        if arrangement is not None:
+            self._cache.move_to_end((height, width))
+            return arrangement
+
+        top, left, bottom, right = (
+            (self.padding,) * 4 if isinstance(self.padding, int) else self.padding
+        )
+        inner_height = max(height - top - bottom, 0)
+        inner_width = max(width - left - right, 0)
+
+        if self.horizontal:
+            main, cross = inner_width, inner_height
+        else:
+            main, cross = inner_height, inner_width
+
+        arrangement = []
+        sizes = _main_sizes([child.size for child in self.children], main, self.gap)
+        position = 0
+        for child, child_main in zip(self.children, sizes):
+            child_main = max(min(child_main, main - position), 0)
+
+            child_cross = (
+                cross
+                if child.cross is None
+                else min(_resolve(child.cross, cross, cross), cross)
+            )
+            if child.align == Alignment.CENTER:
+                offset = (cross - child_cross) // 2
+            elif child.align == Alignment.RIGHT:
+                offset = cross - child_cross
+            else:
+                offset = 0
+
+            if self.horizontal:
+                rect = Rect(top + offset, left + position, child_cross, child_main)
+            else:
+                rect = Rect(top + position, left + offset, child_main, child_cross)
+
+            arrangement.append((child, rect))
+            position += child_main + self.gap
+
+        self._cache[height, width] = arrangement
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+        return arrangement
+
+
+class Row(Box):
+    """A box that lays out its children from left to right."""
+
+    horizontal = True
+
+
+class Column(Box):
+    """A box that lays out its children from top to bottom."""
+
+    horizontal = False
+
+
+def _resolve(size: SizeLike, space: int, flex_space: int) -> int:
+    if isinstance(size, int):
+        return size
+    if isinstance(size, Fixed):
+        return size.cells
+    if isinstance(size, Percent):
+        return int(space * size.percent / 100)
+    return flex_space
+
+
+def _main_sizes(sizes: list[SizeLike], main: int, gap: int) -> list[int]:
+    """The lengths of boxes of `sizes` in a row or column `main` cells long."""
+    space = max(main - gap * (len(sizes) - 1), 0)
+
+    lengths = [_resolve(size, space, 0) for size in sizes]
+    weights = [size.weight if isinstance(size, Flex) else 0 for size in sizes]
+
+    total_weight = sum(weights)
+    if total_weight:
+        left_over = max(space - sum(lengths), 0)
+        shares = [left_over * weight // total_weight for weight in weights]
+
+        # The cells lost to rounding go to the first flexible boxes
+        missing = left_over - sum(shares)
+        for i, weight in enumerate(weights):
+            if weight:
+                lengths[i] = shares[i] + (missing > 0)
+                missing -= 1
+
+    return lengths
+
+
+class Layout:
+    """Lays out a tree of boxes in a frame, again whenever the frame is resized.
+
+    ```
+    layout = Layout(
+        Column(
+            Row(size=3, frame=header),
+            Row(
+                Column(size=Percent(25), frame=sidebar),
+                Column(frame=lambda height, width: Frame.empty_box(height, width)),
+            ),
+        )
+    )
+    layout.place(screen)
+    ```
+    """
+
+    def __init__(self, root: Box) -> None:
+        self.root = root
+
+        self._rects: Optional[tuple[Arrangement, list[tuple[Box, Rect]]]] = None
+        self._container: Optional[Frame] = None
+        self._placed: dict[Box, Frame] = {}
+        self._built: dict[Box, tuple[tuple[int, int], Frame]] = {}
+
+    def arrange(self, height: int, width: int) -> list[tuple[Box, Rect]]:
+        """The rectangles of every box, the root being `height` by `width`.
+
+        Boxes that are the same size as last time reuse the arrangement of their
+        children, so only the boxes whose size or constraints changed are laid
+        out again.
+        """
+        # Any change to the boxes clears the arrangements of the root too
+        arrangement = self.root.arrange(height, width)
+        if self._rects is not None and self._rects[0] is arrangement:
+            return self._rects[1]
+
+        rects = [(self.root, Rect(0, 0, height, width))]
+        for box, rect in rects:  # grows as it goes, one box at a time
+            rects.extend(
+                (child, Rect(rect.y + y, rect.x + x, child_height, child_width))
+                for child, (y, x, child_height, child_width) in box.arrange(
+                    rect.height, rect.width
+                )
+            )
+
+        self._rects = (arrangement, rects)
+        return rects
+
+    def place(self, container: Frame) -> None:
+        """Add the frames of the boxes to `container` as retained frames (or move
+        them), inside its border.
+        """
+        if container is not self._container:
+            self._container = container
+            self._placed = {}
+
+        inset = 1 if container.bordered else 0
+        arrangement = self.arrange(
+            container.height - 2 * inset, container.width - 2 * inset
+        )
+
+        placed = {}
+        with container.batch():
+            for box, rect in arrangement:
+                frame = self._frame_of(box, rect)
+                if (
+                    frame is None
+                    or frame.height > rect.height
+                    or frame.width > rect.width
+                ):
+                    continue
+
+                pos = (rect.y + inset, rect.x + inset)
+                if self._placed.get(box) is frame:
+                    if container._placement(frame).pos != pos:
+                        container.move_frame(frame, pos)
+                else:
+                    if box in self._placed:
+                        container.remove_frame(self._placed[box])
+                    container.add_frame(frame, pos, retained=True)
+                placed[box] = frame
+
+            for box, frame in self._placed.items():
+                if box not in placed:
+                    container.remove_frame(frame)
+
+        self._placed = placed
+
+    def _frame_of(self, box: Box, rect: Rect) -> Optional[Frame]:
+        if box.frame is None or not callable(box.frame):
+            return box.frame
+
+        # Frames made for a size are kept until the box is another size
+        built = self._built.get(box)
+        if built is None or built[0] != rect.size:
+            if rect.height <= 0 or rect.width <= 0:
+                return None
+            built = self._built[box] = (rect.size, box.frame(rect.height, rect.width))
+        return built[1]
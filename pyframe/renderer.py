@@ -0,0 +1,192 @@
+from array import array
+from typing import Iterator, Optional, TextIO
+
+from pyframe.colors import DEFAULT_BACKGROUND, RESET, ColorDepth
+from pyframe.grid import Grid, _palette
+from pyframe.vector import VectorLike, VectorYX
+
+# Unchanged gaps shorter than this are rewritten instead of moving the cursor
+# over them (`\033[y;xH` is at least 6 bytes).
+MIN_GAP = 6
+
+# What a cleared screen shows: default colored spaces
+BLANK = (32, 0, 0)
+
+# The `(start, chars, colors, backgrounds)` runs of content of a row
+Row = list[tuple[int, array, array, array]]
+
+
+def move_cursor(y: int, x: int) -> str:
+    """Escape code to move the cursor to row `y`, column `x` (0 based)."""
+    return f"\033[{y + 1};{x + 1}H"
+
+
+class Renderer:
+    """Writes grids to a terminal, only sending cells changed since the last flush.
+
+    ```
+    renderer = Renderer()
+    renderer.flush(frame, sys.stdout)  # draws everything
+    frame[(1, 1)] = Cell("x")
+    renderer.flush(frame, sys.stdout)  # moves to (1, 1) and draws "x"
+    ```
+
+    A renderer with an `origin` draws its grid there instead of the top left of
+    the screen, and doesn't clear the screen (it draws every cell of the grid
+    the first time), so several renderers can share a terminal.
+    """
+
+    def __init__(
+        self,
+        depth: ColorDepth = ColorDepth.TRUECOLOR,
+        origin: VectorLike = (0, 0),
+    ) -> None:
+        self.depth = depth
+        self.origin = VectorYX(origin)
+
+        self._rows: list[Row] = []
+        self._size: Optional[tuple[int, int]] = None
+
+        self.bytes_written = 0
+
+    def reset(self) -> None:
+        """Forget the last flushed grid, so the next flush redraws everything."""
+        self._rows = []
+        self._size = None
+
+    def render(self, grid: Grid) -> str:
+        """Get the escape codes that update the previous grid to `grid`, and remember `grid`."""
+        output = []
+        origin_y, origin_x = self.origin
+        cleared = not (origin_y or origin_x)
+
+        if grid.size != self._size:
+            if cleared:
+                output.append("\033[2J")  # clear screen
+            self._rows = []
+            self._size = grid.size
+
+        pre_color = None
+        pre_background = 0
+        for y in range(grid.height):
+            # Only the content of rows is kept, the rest is blank on the screen
+            row = [
+                (start, *grid._row_codes(y, start, stop))
+                for start, stop in grid._content_spans(y)
+            ]
+
+            if y < len(self._rows):
+                pre_row = self._rows[y]
+                if pre_row == row:
+                    continue
+                self._rows[y] = row
+                changed = _changed(pre_row, row)
+            else:
+                self._rows.append(row)
+                # The screen was cleared, or whatever is there has to be covered
+                changed = _changed([], row) if cleared else range(grid.width)
+
+            chars, colors, backgrounds = _expand(row, grid.width)
+
+            for start, stop in _runs(changed):
+                output.append(move_cursor(origin_y + y, origin_x + start))
+
+                for x in range(start, stop):
+                    if colors[x] != pre_color:
+                        output.append(_palette[colors[x]].depth_sgr(self.depth))
+                        pre_color = colors[x]
+                    if backgrounds[x] != pre_background:
+                        output.append(
+                            _palette[backgrounds[x] - 1].depth_sgr(
+                                self.depth, background=True
+                            )
+                            if backgrounds[x]
+                            else DEFAULT_BACKGROUND
+                        )
+                        pre_background = backgrounds[x]
+
+                    output.append(chr(chars[x]) if chars[x] else " ")
+
+        if pre_color is not None:
+            output.append(RESET)
+
+        return "".join(output)
+
+    def flush(self, grid: Grid, stream: TextIO) -> int:
+        """Write the changes since the last flush to `stream`.
+
+        Returns the amount of bytes written.
+        """
+        output = self.render(grid)
+        if output:
+            stream.write(output)
+            stream.flush()
+
+        written = len(output.encode())
+        self.bytes_written += written
+        return written
+
+
+def _changed(pre_row: Row, row: Row) -> list[int]:
+    """The columns that differ between two rows of `(start, chars, colors,
+    backgrounds)` runs, the columns outside of the runs being blank.
+    """
+    if [(start, len(chars)) for start, chars, _, _ in pre_row] == [
+        (start, len(chars)) for start, chars, _, _ in row
+    ]:
+        return [
+            x
+            for (start, *new), (_, *old) in zip(row, pre_row)
+            for x, (new_cell, old_cell) in enumerate(zip(zip(*new), zip(*old)), start)
+            if new_cell != old_cell
+        ]
+
+    if not pre_row:
+        return [
+            x for start, chars, _, _ in row for x in range(start, start + len(chars))
+        ]
+
+    cells = dict(_content(row))
+    pre_cells = dict(_content(pre_row))
+    return sorted(
+        x for x in cells.keys() | pre_cells.keys() if cells.get(x) != pre_cells.get(x)
+    )
+
+
+def _content(row: Row) -> Iterator[tuple[int, tuple[int, int, int]]]:
+    """The columns of `row` that aren't blank, with their packed `(char, color,
+    background)`.
+    """
+    return (
+        (x, cell)
+        for start, *codes in row
+        for x, cell in enumerate(zip(*codes), start)
+        if cell[1] or cell[2] or cell[0] not in (0, 32)
+    )
+
+
+def _expand(row: Row, width: int) -> tuple[array, array, array]:
+    """The packed characters, colors and backgrounds of the whole of `row`."""
+    if len(row) == 1 and row[0][0] == 0 and len(row[0][1]) == width:
+        return row[0][1:]
+
+    chars = array("I", [BLANK[0]]) * width
+    colors = array("I", bytes(4 * width))
+    backgrounds = array("I", bytes(4 * width))
+    for start, *codes in row:
+        stop = start + len(codes[0])
+        chars[start:stop], colors[start:stop], backgrounds[start:stop] = codes
+
+    return chars, colors, backgrounds
+
+
+def _runs(changed) -> list[tuple[int, int]]:
+    """Group sorted columns into `(start, stop)` runs, joining small gaps."""
+    runs = []
+    for x in changed:
+        if runs and x - runs[-1][1] < MIN_GAP:
+            runs[-1][1] = x + 1
+        else:
+            runs.append([x, x + 1])
+
+    return [(start, stop) for start, stop in runs]
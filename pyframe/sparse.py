@@ -0,0 +1,232 @@
+from array import array
+from bisect import insort
+from typing import Generator, Iterable
+
+from pyframe.grid import Grid
+
+# The packed arrays of a tile: characters, colors and backgrounds
+Tile = tuple[array, array, array]
+
+
+class Tiles:
+    """The square tiles of a `height` by `width` grid, created on first write.
+
+    Untouched tiles read as `fill` characters with the default colors.
+    """
+
+    def __init__(self, height: int, width: int, fill: str, size: int) -> None:
+        self.height = height
+        self.width = width
+        self.size = size
+        self.fills = (ord(fill) if fill else 0, 0, 0)
+
+        self.tiles: dict[tuple[int, int], Tile] = {}
+        self.bands: dict[int, list[int]] = {}  # tile row -> sorted tile columns
+
+    def create(self, key: tuple[int, int]) -> Tile:
+        area = self.size * self.size
+        tile = self.tiles[key] = (
+            array("I", [self.fills[0]]) * area,
+            array("I", bytes(4 * area)),
+            array("I", bytes(4 * area)),
+        )
+        insort(self.bands.setdefault(key[0], []), key[1])
+        return tile
+
+    def copy(self) -> "Tiles":
+        tiles = Tiles.__new__(Tiles)
+        tiles.__dict__.update(self.__dict__)
+        tiles.tiles = {
+            key: tuple(storage[:] for storage in tile)
+            for key, tile in self.tiles.items()
+        }
+        tiles.bands = {band: columns[:] for band, columns in self.bands.items()}
+        return tiles
+
+    def locate(self, i: int) -> tuple[tuple[int, int], int]:
+        """The tile a flat position is in and its position in the tile."""
+        y, x = divmod(i, self.width)
+        size = self.size
+        return (y // size, x // size), y % size * size + x % size
+
+    def segments(
+        self, start: int, stop: int, step: int
+    ) -> Generator[tuple[int, tuple[int, int], int, int, int], None, None]:
+        """Split the flat positions `range(start, stop, step)` into runs in one tile.
+
+        Yields `(done, tile key, position in tile, step in tile, count)`, `done`
+        being how many positions came before the run.
+        """
+        width, size = self.width, self.size
+        total = len(range(start, stop, step))
+        done = 0
+        i = start
+
+        if step == 1:
+            while done < total:
+                y, x = divmod(i, width)
+                count = min(total - done, width - x, size - x % size)
+                key = (y // size, x // size)
+                yield done, key, y % size * size + x % size, 1, count
+                i += count
+                done += count
+
+        elif step > 0 and step % width == 0:  # down a column
+            rows = step // width
+            while done < total:
+                y, x = divmod(i, width)
+                count = min(total - done, (size - y % size + rows - 1) // rows)
+                key = (y // size, x // size)
+                yield done, key, y % size * size + x % size, rows * size, count
+                i += count * step
+                done += count
+
+        else:
+            for done, i in enumerate(range(start, stop, step)):
+                yield done, *self.locate(i), 1, 1
+
+
+class TiledArray:
+    """One of the packed arrays of a `SparseGrid`, backed by its `Tiles`.
+
+    Indexes and slices work like the flat arrays of a `Grid` (slices are copied
+    into real arrays), so the `Grid` methods don't know the difference.
+    """
+
+    def __init__(self, tiles: Tiles, field: int) -> None:
+        self.tiles = tiles
+        self.field = field
+        self.typecode = "III"[field]
+        self.fill = tiles.fills[field]
+
+    def __len__(self) -> int:
+        return self.tiles.height * self.tiles.width
+
+    def __getitem__(self, item: int | slice):
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            values = array(self.typecode, [self.fill]) * len(range(start, stop, step))
+
+            for done, key, pos, tile_step, count in self.tiles.segments(
+                start, stop, step
+            ):
+                tile = self.tiles.tiles.get(key)
+                if tile is not None:
+                    values[done : done + count] = tile[self.field][
+                        pos : pos + tile_step * count : tile_step
+                    ]
+
+            return values
+
+        key, pos = self.tiles.locate(self._check(item))
+        tile = self.tiles.tiles.get(key)
+        return self.fill if tile is None else tile[self.field][pos]
+
+    def __setitem__(self, item: int | slice, value) -> None:
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if not isinstance(value, array):
+                value = array(self.typecode, value)
+            if len(value) != len(range(start, stop, step)):
+                raise ValueError("tiled arrays can't be resized")
+
+            for done, key, pos, tile_step, count in self.tiles.segments(
+                start, stop, step
+            ):
+                values = value[done : done + count]
+                tile = self.tiles.tiles.get(key)
+                if tile is None:
+                    if values.count(self.fill) == count:
+                        continue  # still blank
+                    tile = self.tiles.create(key)
+
+                tile[self.field][pos : pos + tile_step * count : tile_step] = values
+            return
+
+        key, pos = self.tiles.locate(self._check(item))
+        tile = self.tiles.tiles.get(key)
+        if tile is None:
+            if value == self.fill:
+                return
+            tile = self.tiles.create(key)
+        tile[self.field][pos] = value
+
+    def _check(self, i: int) -> int:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("array index out of range")
+        return i
+
+    def __iter__(self):
+        return iter(self[:])
+
+
+class SparseGrid(Grid):
+    """A grid for huge, mostly blank canvases, which stores its cells in tiles.
+
+    A tile of `TILE_SIZE` by `TILE_SIZE` cells is only created when something other
+    than `fill` is written to it, so memory grows with what is drawn rather than
+    with the size of the grid. Otherwise it works like any other grid.
+
+    ```
+    world = SparseGrid(10_000, 10_000)
+    world.write_text((5000, 5000), "here")  # creates one tile
+    ```
+
+    Filling or coloring all of it creates every tile.
+    """
+
+    TILE_SIZE = 64
+
+    def __init__(self, height: int, width: int, fill: str = " ") -> None:
+        self._allocate(height, width, fill)
+
+    def _allocate(self, height: int, width: int, fill: str = " ") -> None:
+        self.height = height
+        self.width = width
+        self._offset = 0
+        self._stride = width
+        self.fill = fill
+
+        self._tiles = Tiles(height, width, fill, self.TILE_SIZE)
+        self._use_tiles()
+        self._objects = {}
+
+    def _use_tiles(self) -> None:
+        self._chars, self._colors, self._backgrounds = (
+            TiledArray(self._tiles, field) for field in range(3)
+        )
+
+    @property
+    def tile_count(self) -> int:
+        """How many tiles have been created."""
+        return len(self._tiles.tiles)
+
+    def copy(self) -> "SparseGrid":
+        grid = SparseGrid.__new__(SparseGrid)
+        grid.__dict__.update(self.__dict__)
+        grid._tiles = self._tiles.copy()
+        grid._use_tiles()
+        grid._objects = dict(self._objects)
+        return grid
+
+    def _content_spans(self, y: int) -> list[tuple[int, int]]:
+        if self.fill != " ":
+            return super()._content_spans(y)
+
+        size = self.TILE_SIZE
+        return _merge_spans(
+            (column * size, min((column + 1) * size, self.width))
+            for column in self._tiles.bands.get(y // size, ())
+        )
+
+
+def _merge_spans(spans: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    merged = []
+    for start, stop in spans:
+        if merged and merged[-1][1] == start:
+            merged[-1] = (merged[-1][0], stop)
+        else:
+            merged.append((start, stop))
+    return merged
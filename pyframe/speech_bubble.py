@@ -1,162 +1,163 @@
+import asyncio
+import sys
 from textwrap import wrap
-from time import sleep
-from typing import Optional
+from typing import Optional, TextIO
+
+from pyframe.border.border_type import BorderType
 from pyframe.border.border_types import Borders
-from pyframe.frame import Frame, Title, Cell
+from pyframe.frame import Frame, Title
 from pyframe.grid import Grid
-from pyframe.border.border_type import BorderType, Thickness
-from pyframe.colors import Colors, Color
-from pyframe.types_ import Alignment, TitleSide, VerticalAlignment
-
-from pyframe.border.border_type import Thickness
-
-from math import ceil
-from pyframe.vector import VectorYX
-from textwrap import wrap
-from pyframe.textbox import Textbox
+from pyframe.renderer import Renderer
+from pyframe.types_ import Alignment
+
+# Pauses after punctuation, in seconds
+DELAYS = {
+    ".": 1.00,
+    "?": 1.00,
+    "!": 1.00,
+    ";": 0.75,
+    ",": 0.50,
+    ":": 0.50,
+}
+
+SPED_UP_DELAYS = {
+    ".": 0.50,
+    "?": 0.50,
+    "!": 0.50,
+    ";": 0.35,
+    ",": 0.25,
+    ":": 0.25,
+}
+
+
+class SpeechBubble(Frame):
+    """A box that types out `message` a character at a time, a page at a time.
+
+    ```
+    async def main():
+        skip = asyncio.Event()
+        await asyncio.gather(
+            SpeechBubble("Hello there!", 5, 30, "Alice").play(Renderer()),
+            SpeechBubble("Hi.", 5, 30, "Bob").play(Renderer(origin=(6, 0)), skip=skip),
+        )
+    ```
 
+    The text is wrapped once up front, so words don't jump to the next line while
+    they're typed. `| x ⏷ |` is the layout of a row.
+    """
 
-class SpeechBubble(Textbox):
     def __init__(
         self,
         message: str,
         height: int,
         width: int,
-        speaker: Optional[str] = None,
+        speaker: Optional[str | Title] = None,
         text_alignment: Alignment = Alignment.LEFT,
         block_char: str = "⏷",
         border_type: BorderType = Borders.Thin.ROUND,
-        # default_delay: float = 0.03,
-        # default_sped_up_delay: float = 0.01,
-        # delays: dict[str, float] = ...,
-        # sped_up_delays: dict[str, float] = ...,
-        # speed_key: str = " ",
-        # block_key: str = " ",
+        default_delay: float = 0.03,
+        default_sped_up_delay: float = 0.01,
+        delays: Optional[dict[str, float]] = None,
+        sped_up_delays: Optional[dict[str, float]] = None,
         block: bool = True,
     ) -> None:
-        
-        # self.text = text
-        # self.size = size
-
-        # self.text_alignment = text_alignment
-        # self.author = author
-        # self.author_color = author_color
-        # self.border_color = border_color
-        # self.text_color = text_color
-        # self.border_type = border_type
-
-        # self.wrap_width = self.size.inner.width - 6  # | x ⏷ |
-        # self.text_width = self.size.inner.width - 3  # | x |
-
-        # self.block_char = block_char
-        # self.speed_key = speed_key
-        # self.block = False
-        # self.default_delay = default_delay
-        # self.default_sped_up_delay = default_sped_up_delay
-
-        # self.delays = delays
-        # if self.delays is ...:
-        #     self.delays = {
-        #         ".": 1.00,
-        #         "?": 1.00,
-        #         ";": 0.75,
-        #         ",": 0.50,
-        #         ":": 0.50,
-        #     }
-
-        # self.sped_up_delays = sped_up_delays
-        # if self.sped_up_delays is ...:
-        #     self.sped_up_delays = {
-        #         ".": 0.50,
-        #         "?": 0.50,
-        #         ";": 0.35,
-        #         ",": 0.25,
-        #         ":": 0.25,
-        #     }
-        # self.block_key = block_key
-
-        def speech():
-            self.clear()
-            lines = wrap(text, self.wrap_width)
-            lines = [line.split() for line in lines]
-
-            for index, line in enumerate(lines):
-                for word in line:
-                    if self.block:
-                        self.refresh()
-
-                        wait(block_key)
-                        self.block = False
-
-                    for char in word:
-                        self.add(char)
-
-                        self.refresh()
-
-                        if is_pressed(self.speed_key):
-                            sleep(
-                                self.sped_up_delays.get(
-                                    char, self.default_sped_up_delay
-                                )
-                            )
-                        else:
-                            sleep(self.delays.get(char, self.default_delay))
-
-                    self.add(" ")
-
-                #      If theres fully new display             OR    the last iteration   AND block is True then...
-                if (
-                    (index - 1) % self.size.inner.height == 0 or index == len(lines) - 1
-                ) and block:
-                    self.block = True
-
-            return True
-
-        self.event = speech
-
-    def __str__(self) -> str:
-        lines = wrap(self.text, self.wrap_width)[
-            -self.size.inner.height :
-        ]  # Last lines
-
-        string = ""
-        for i in range(self.size.inner.height):
-            line = None
-            if i <= len(lines) - 1:
-                line = ""
-                match self.text_alignment:
-                    case Alignment.CENTER:
-                        line = f" {lines[i]:^{self.text_width}} \n"
-                    case Alignment.RIGHT:
-                        line = f" {lines[i]:>{self.text_width}} \n"
-                    case Alignment.LEFT:
-                        line = f" {lines[i]:<{self.text_width}} \n"
-
-                if self.block and i == len(lines) - 1:
-                    line = line[:-3] + self.block_char + line[-2:]
-            else:
-                line = f' {" ":<{self.text_width}} \n'
-
-            string += line
-
-        self.textbox = Frame.map(
-            string,
-            self.author,
-            border_color=self.border_color,
-            title_color=self.author_color,
-            border_type=self.border_type,
-            base_color=self.text_color,
+        super().__init__(Grid.empty(height - 2, width - 2), border_type)
+
+        self.message = message
+        self.text_alignment = text_alignment
+        self.block_char = block_char
+        self.default_delay = default_delay
+        self.default_sped_up_delay = default_sped_up_delay
+        self.delays = DELAYS if delays is None else delays
+        self.sped_up_delays = (
+            SPED_UP_DELAYS if sped_up_delays is None else sped_up_delays
         )
+        self.block = block
 
-        return str(self.textbox)
+        if speaker is not None:
+            self.add_title(speaker if isinstance(speaker, Title) else Title(speaker))
 
-    def add(self, text: str) -> None:
-        """Adds text to the TextBox."""
-        self.text += text
+        self.text_width = width - 6
+        lines = wrap(message, self.text_width)
+        page_height = height - 2
+        self.pages = [
+            lines[i : i + page_height] for i in range(0, len(lines), page_height)
+        ]
 
     def clear(self) -> None:
-        """Clears the TextBox's text"""
-        self.text = ""
+        """Blank out the text."""
+        self.fill_rect(
+            ((1, 1), (self.height - 2, self.width - 2)), color=self.base_color
+        )
 
-    def refresh(self) -> None:
-        Screen.write(str(self))
+    def _page_cells(self, page: list[str]) -> list[tuple[int, int, str]]:
+        """The `(y, x, char)` of the characters of `page`, in typing order."""
+        cells = []
+        for y, line in enumerate(page, 1):
+            aligned = self.text_alignment.align(line, self.text_width)
+            start = aligned.index(line) if line else 0
+            cells.extend(
+                (y, x, char) for x, char in enumerate(line, 2 + start) if char != " "
+            )
+        return cells
+
+    def _delay(self, char: str, speed_up: Optional[asyncio.Event]) -> float:
+        if speed_up is not None and speed_up.is_set():
+            return self.sped_up_delays.get(char, self.default_sped_up_delay)
+        return self.delays.get(char, self.default_delay)
+
+    async def play(
+        self,
+        renderer: Renderer,
+        stream: Optional[TextIO] = None,
+        speed_up: Optional[asyncio.Event] = None,
+        skip: Optional[asyncio.Event] = None,
+        proceed: Optional[asyncio.Event] = None,
+    ) -> None:
+        """Type out the message, flushing the cells that changed to `stream`
+        (stdout by default) through `renderer` after each character.
+
+        - `speed_up` -> the sped up delays are used while it's set
+        - `skip` -> setting it shows the rest of the page at once (it's cleared
+          for the next page)
+        - `proceed` -> if `block`, the bubble shows `block_char` and waits for it
+          (and clears it) when a page is done
+
+        Waiting doesn't block the event loop, so many bubbles can play at once
+        (with renderers at different origins).
+        """
+        stream = stream or sys.stdout
+
+        for page in self.pages or [[]]:
+            self.clear()
+            renderer.flush(self, stream)
+
+            for y, x, char in self._page_cells(page):
+                self.write_text((y, x), char, self.base_color)
+                if skip is not None and skip.is_set():
+                    continue  # the rest is flushed at once
+
+                renderer.flush(self, stream)
+                delay = self._delay(char, speed_up)
+                if skip is None:
+                    await asyncio.sleep(delay)
+                else:
+                    try:
+                        await asyncio.wait_for(skip.wait(), delay)
+                    except TimeoutError:
+                        pass
+
+            renderer.flush(self, stream)
+            if skip is not None:
+                skip.clear()
+
+            if self.block and proceed is not None:
+                block_pos = (max(len(page), 1), self.width - 3)
+                self.write_text(block_pos, self.block_char, self.base_color)
+                renderer.flush(self, stream)
+
+                await proceed.wait()
+                proceed.clear()
+
+                self.write_text(block_pos, " ", self.base_color)
+                renderer.flush(self, stream)
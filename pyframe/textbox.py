@@ -1,6 +1,7 @@
+from bisect import bisect_right
 from textwrap import wrap
 from time import sleep
-from typing import Optional
+from typing import Optional, Self
 from pyframe.border.border_types import Borders
 from pyframe.frame import Frame, Title, Cell
 from pyframe.grid import Grid
@@ -15,6 +16,22 @@ from pyframe.vector import VectorYX
 from textwrap import wrap
 
 
+# What `wrap` turns into spaces (after expanding tabs)
+_WHITESPACE = str.maketrans("\t\n\x0b\x0c\r", "     ")
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """How many characters `a` and `b` start with in common."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:  # compares slices, which is faster than char by char
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
 class Textbox(Frame):
     def __init__(
         self,
@@ -28,37 +45,128 @@ class Textbox(Frame):
     ):
         """Wraps text to a frame"""
         padding = 2 + 2
-        wrapped_lines = wrap(text, width - 2 - horizontal_padding * 2)
+        self._wrap_width = width - 2 - horizontal_padding * 2
+        self._line_width = width - padding // 2 - 1
+        self._lines = lines
+        self._text_alignment = text_alignment
+        self._vertical_text_alignment = vertical_text_alignment
+
+        # The wrapped lines and where each starts in the text (with whitespace
+        # replaced like `wrap` does), so changes only rewrap from where they are
+        self._munged = ""
+        self._wrapped: list[str] = []
+        self._line_starts: list[int] = []
+        self._rewrap(text)
+
+        self._rows = self._format_rows()
+        formatted_text = Grid("\n".join(self._rows), text_alignment)
+
+        super().__init__(formatted_text, border_type)
+
+        self.text = text
+
+    def clone(self) -> Self:
+        clone = super().clone()
+        # `_rewrap` changes these in place
+        clone._wrapped = self._wrapped.copy()
+        clone._line_starts = self._line_starts.copy()
+        return clone
+
+    def append(self, text: str) -> None:
+        """Add `text` to the end of the text."""
+        self.set_text(self.text + text)
 
-        amount_of_text_lines = len(wrapped_lines)
-        total_lines = lines or amount_of_text_lines
+    def set_text(self, text: str) -> None:
+        """Change the text, only rewrapping from the line before the first change
+        and rewriting the rows that look different.
+
+        The textbox grows (or shrinks) if the text needs another amount of lines
+        than before (and `lines` wasn't given), or lines too long for its width.
+        """
+        self._rewrap(text)
+        self.text = text
+
+        rows = self._format_rows()
+        width = max(map(len, rows), default=0)
+        if (len(rows), width) != (self.height - 2, self.width - 2):
+            self._rows = rows
+            self._refill(Grid("\n".join(rows), self._text_alignment))
+            return
+
+        for y, (row, pre_row) in enumerate(zip(rows, self._rows), 1):
+            if row != pre_row:
+                # Leveled out like `Grid` does
+                padding = width - len(row)
+                if self._text_alignment == Alignment.RIGHT:
+                    row = " " * padding + row
+                elif self._text_alignment == Alignment.CENTER:
+                    row = " " * (padding // 2) + row + " " * (padding - padding // 2)
+                else:
+                    row = row + " " * padding
+
+                self.write_text((y, 1), row, self.base_color)
+        self._rows = rows
+
+    def _rewrap(self, text: str) -> None:
+        munged = text.expandtabs().translate(_WHITESPACE)
+
+        # The lines before one starting with a whole word that ends before the
+        # first change are wrapped the same as before (they only depend on the
+        # text up to the end of that word)
+        changed = _common_prefix_length(self._munged, munged)
+        line = bisect_right(self._line_starts, changed) - 1
+        while line > 0:
+            start = self._line_starts[line]
+            if (
+                0 <= munged.find(" ", start) < changed
+                and munged[start - 1] == " "
+                and munged[start] != " "
+            ):
+                break
+            line -= 1
+        line = max(line, 0)
+        start = self._line_starts[line] if line else 0
+
+        self._munged = munged
+        del self._wrapped[line:]
+        del self._line_starts[line:]
+
+        position = start
+        for wrapped_line in wrap(munged[start:], self._wrap_width):
+            position = munged.index(wrapped_line, position)
+            self._wrapped.append(wrapped_line)
+            self._line_starts.append(position)
+            position += len(wrapped_line)
+
+    def _format_rows(self) -> list[str]:
+        """The rows of text inside the border (not yet leveled out)."""
+        amount_of_text_lines = len(self._wrapped)
+        # Without text (or `lines`) it's still a box, of one blank line
+        total_lines = self._lines or max(amount_of_text_lines, 1)
         blank_lines = total_lines - amount_of_text_lines
 
-        if vertical_text_alignment == VerticalAlignment.DOWN:
+        if self._vertical_text_alignment == VerticalAlignment.DOWN:
             top = [" "] * blank_lines
             bottom = []
-        elif vertical_text_alignment == VerticalAlignment.UP:
+        elif self._vertical_text_alignment == VerticalAlignment.UP:
             top = []
             bottom = [" "] * blank_lines
         else:
             top = [" "] * (blank_lines // 2)
             bottom = [" "] * ((blank_lines - 1) // 2 + 1)
 
-        wrapped_lines = top + wrapped_lines + bottom
-
         aligned_lines = [
-            text_alignment.align(line, width - padding // 2 - 1)
-            for line in wrapped_lines
+            self._text_alignment.align(line, self._line_width)
+            for line in top + self._wrapped + bottom
         ]
 
-        formatted_text = Grid(
-            [
-                ([Cell(" ")] if row[0] != " " else []) + [Cell(cell) for cell in row]
-                for row in aligned_lines
-            ],
-            text_alignment,
-        )
+        return [(" " if row[0] != " " else "") + row for row in aligned_lines]
 
-        super().__init__(formatted_text, border_type)
+    def _refill(self, grid: Grid) -> None:
+        """Replace the text with `grid`, which is another size."""
+        self._adopt(grid)
+        self._ring_reserved = False
+        self.border()
 
-        self.text = text
+        if self.base_color is not None:
+            self.color_inner(self.base_color)